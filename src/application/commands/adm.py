@@ -5,12 +5,8 @@ import discord
 from discord.ext import commands
 
 from application.use_cases.bot_use_cases import BotLifecycleUseCase
-from infrastructure.repositories import (
-    DiscordChannelRepository,
-    SQLiteCategoryRepository,
-)
 from presentation.controllers.bot_controller import BotController
-from presentation.controllers.channel_controller import ChannelController
+from presentation.controllers.channel_controller import get_channel_controller
 
 if TYPE_CHECKING:
     from discord import CategoryChannel
@@ -27,9 +23,8 @@ class ADM(commands.Cog):
         self.bot = bot
 
         # 🏗️ Injeção de dependência (Clean Architecture!)
-        category_db_repository = SQLiteCategoryRepository()
-        channel_repository = DiscordChannelRepository(bot, category_db_repository)
-        self.channel_controller = ChannelController(channel_repository)
+        # ♻️ Controller compartilhado do bot (mesmos caches do manager)
+        self.channel_controller = get_channel_controller(bot)
         
         # 🤖 Bot lifecycle controller
         bot_lifecycle_use_case = BotLifecycleUseCase(bot)
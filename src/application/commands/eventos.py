@@ -10,16 +10,17 @@
     Discord Events → Presentation Layer → Use Cases → Domain → Infrastructure
 """
 
+import asyncio
 import logging
 
 import discord
 from discord.ext import commands
 
-from infrastructure.repositories import (
-    DiscordChannelRepository,
-    SQLiteCategoryRepository,
+from config import (
+    VOICE_EVENT_QUEUE_SIZE,
+    VOICE_EVENT_WORKERS,
 )
-from presentation.controllers.channel_controller import ChannelController
+from presentation.controllers.channel_controller import get_channel_controller
 
 logger = logging.getLogger(__name__)
 audit = logging.getLogger("audit")
@@ -46,9 +47,74 @@ class Eventos(commands.Cog):
 
         # 🏗️ Injeção de dependência correta - Clean Architecture!
         # 💡 Boa Prática: Repository de banco separado do repository Discord
-        category_db_repository = SQLiteCategoryRepository()
-        channel_repository = DiscordChannelRepository(bot, category_db_repository)
-        self.channel_controller = ChannelController(channel_repository)
+        # ♻️ Controller compartilhado do bot (mesmos caches do manager)
+        self.channel_controller = get_channel_controller(bot)
+
+        # 🎧 Filas de eventos de voz, uma por worker
+        # 💡 Mesmo membro cai sempre na mesma fila: a ordem dos eventos é mantida
+        self._voice_queues: list[
+            asyncio.Queue[tuple[discord.Member, discord.VoiceState, discord.VoiceState]]
+        ] = [
+            asyncio.Queue(maxsize=VOICE_EVENT_QUEUE_SIZE // VOICE_EVENT_WORKERS)
+            for _ in range(VOICE_EVENT_WORKERS)
+        ]
+        self._voice_workers: list[asyncio.Task] = []
+
+    async def cog_load(self) -> None:
+        """🚀 Inicia os workers de eventos de voz"""
+        # 💡 Sem o intent de voz o gateway não envia esses eventos
+        if not self.bot.intents.voice_states:
+            return
+
+        self._voice_workers = [
+            asyncio.create_task(self._voice_worker(queue))
+            for queue in self._voice_queues
+        ]
+
+    async def cog_unload(self) -> None:
+        """🛑 Encerra os workers de eventos de voz"""
+        for task in self._voice_workers:
+            task.cancel()
+        await asyncio.gather(*self._voice_workers, return_exceptions=True)
+        self._voice_workers = []
+
+    async def _enqueue_voice(
+        self,
+        member: discord.Member,
+        before: discord.VoiceState,
+        after: discord.VoiceState,
+    ) -> None:
+        """
+        📥 Entrega o evento à fila do worker responsável pelo membro
+
+        💡 Boa Prática: Fila cheia aguarda vaga - troca de canal nunca é descartada!
+        """
+        queue = self._voice_queues[member.id % VOICE_EVENT_WORKERS]
+        await queue.put((member, before, after))
+
+    async def _voice_worker(
+        self,
+        queue: asyncio.Queue[
+            tuple[discord.Member, discord.VoiceState, discord.VoiceState]
+        ],
+    ) -> None:
+        """
+        🔄 Consome eventos de voz da fila e delega ao Controller
+
+        💡 Boa Prática: O gateway só enfileira, o trabalho pesado fica aqui!
+        """
+        while True:
+            member, before, after = await queue.get()
+            try:
+                await self.channel_controller.handle_voice_state_update(
+                    member=member,
+                    before=before,
+                    after=after,
+                )
+            except Exception:
+                logger.exception("❌ Erro ao processar evento de voz de %s", member.name)
+            finally:
+                queue.task_done()
 
     @commands.Cog.listener()
     async def on_voice_state_update(
@@ -72,14 +138,15 @@ class Eventos(commands.Cog):
             - Deletar sala temporária quando ficar vazia
             - Transferir ownership se dono sair
         """
+        # ⚡ Mute/deafen/câmera não mudam de canal: nada a fazer
+        if before.channel == after.channel:
+            return
+
         logger.debug("🎧 Voice state update: %s", member.name)
 
-        # 🎯 STEP 1: Delega para o Controller (Presentation Layer)
-        await self.channel_controller.handle_voice_state_update(
-            member=member,
-            before=before,
-            after=after,
-        )
+        # 🎯 STEP 1: Entrega aos workers (cada troca de canal é um evento)
+        # 💡 Sem agrupar: A→B→C precisa da saída de B para limpar a sala
+        await self._enqueue_voice(member, before, after)
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member) -> None:
@@ -29,12 +29,13 @@ class Normy(commands.Cog):
         nome_completo = " ".join(nome)
         logger.info("📝 Alteração solicitada: %s -> '%s'", nome, nome_completo)
 
-        # ✅ Validação de tamanho
-        if len(nome_completo) > 32:
+        # ✅ Validação de tamanho (o Discord conta caracteres, não bytes)
+        tamanho = len(nome_completo)
+        if tamanho > 32:
             await ctx.send("❌ Nome muito longo! Máximo 32 caracteres.")
             return
 
-        if len(nome_completo) < 2:
+        if tamanho < 2:
             await ctx.send("❌ Nome muito curto! Mínimo 2 caracteres.")
             return
 
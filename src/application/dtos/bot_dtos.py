@@ -7,7 +7,7 @@ Data Transfer Objects para operações do bot.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ShutdownRequest:
     """Requisição para desligar o bot"""
     admin_name: str
@@ -15,7 +15,7 @@ class ShutdownRequest:
     reason: str = "Comando administrativo"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ShutdownResponse:
     """Resposta do desligamento"""
     success: bool
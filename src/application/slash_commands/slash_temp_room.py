@@ -9,6 +9,7 @@ import contextlib
 import logging
 from typing import TYPE_CHECKING
 
+import aiosqlite
 import discord
 from discord import app_commands
 from discord.ext import commands
@@ -49,10 +50,7 @@ class TempRoomSlashCommands(commands.Cog):
 
         # Busca no banco de dados quem é o dono
         try:
-            import aiosqlite
-
-            db_path = DB_PATH
-            async with aiosqlite.connect(db_path) as db:
+            async with aiosqlite.connect(DB_PATH) as db:
                 cursor = await db.execute(
                     """
                     SELECT owner_id
@@ -5,6 +5,8 @@
 
 import logging
 
+import aiosqlite
+
 from config import DB_PATH
 from domain.entities import ChannelType, TextChannel, VoiceChannel
 from domain.events import DomainEvent
@@ -179,13 +181,10 @@ class CreateChannelUseCase:
         Returns:
             True se salvou com sucesso
         """
-        import aiosqlite
-
         try:
             logger.debug("💾 Salvando canal temporário no banco: %s", channel_name)
 
-            db_path = DB_PATH
-            async with aiosqlite.connect(db_path) as db:
+            async with aiosqlite.connect(DB_PATH) as db:
                 await db.execute(
                     """
                     INSERT INTO temporary_channels
@@ -480,13 +479,10 @@ class CreateForumUseCase:
         Returns:
             True se salvou com sucesso
         """
-        import aiosqlite
-
         try:
             logger.info("💾 Salvando fórum no banco: %s", forum_name)
 
-            db_path = DB_PATH
-            async with aiosqlite.connect(db_path) as db:
+            async with aiosqlite.connect(DB_PATH) as db:
                 # 🔍 Verifica se tabela existe, se não cria
                 await db.execute("""
                     CREATE TABLE IF NOT EXISTS forums (
@@ -19,6 +19,10 @@ DB_PATH = SRC_ROOT / "infrastructure" / "database" / "discord_bot.db"
 # 💡 Boa Prática: Banco separado para logs de auditoria
 AUDIT_DB_PATH = SRC_ROOT / "infrastructure" / "database" / "auditoria.db"
 
+# 🔁 Hash da árvore de slash commands já sincronizada
+# 💡 Evita tree.sync() quando os comandos não mudaram desde o último deploy
+COMMAND_TREE_HASH_PATH = SRC_ROOT / "infrastructure" / "database" / ".command_tree.hash"
+
 # �📄 Scripts SQL
 # 💡 Para adicionar novos scripts, basta adicionar aqui!
 SQL_SCRIPTS_PATH = SRC_ROOT / "infrastructure" / "database"
@@ -38,6 +42,10 @@ DEFAULT_TEMP_ROOM_LIMIT = 10  # Limite padrão de membros em salas temporárias
 TEMP_ROOM_PREFIX = "🎮"  # Prefixo visual para salas temporárias
 MAX_VOICE_CHANNEL_USERS = 99  # Limite máximo de usuários em canal de voz
 TEMP_ROOM_EMPTY_TIMEOUT = 3  # Segundos para aguardar antes de deletar sala vazia
+VOICE_EVENT_WORKERS = 8  # Workers processando eventos de voz em paralelo
+VOICE_EVENT_QUEUE_SIZE = 512  # Eventos de voz pendentes antes de aguardar vaga
+TEMP_ROOM_NEGATIVE_CACHE_TTL = 30  # Segundos de cache: canal/categoria não temporário, categoria geradora
+TEMP_ROOM_DELETE_CONCURRENCY = 8  # Salas deletadas em paralelo numa limpeza em lote
 
 # 📝 Configurações de Canais Únicos (Fóruns)
 # 💡 Valores padrão para fóruns privados de membros
@@ -71,6 +79,7 @@ HUNDRED_ROOMS_MILESTONE = 100  # 100 canais criados
 # 💡 Delays e timeouts para operações
 BOT_SHUTDOWN_DELAY = 1  # Segundos para aguardar antes de desligar
 DATABASE_CACHE_SIZE = 10000  # Tamanho do cache SQLite PRAGMA
+DATABASE_BUSY_TIMEOUT = 5000  # Milissegundos que o SQLite espera por um lock
 
 # 🎯 Configurações de Pattern Matching
 # 💡 Valores para decision making com pattern matching
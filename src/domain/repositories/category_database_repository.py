@@ -118,6 +118,29 @@ class CategoryDatabaseRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def classify_voice_channel(
+        self,
+        channel_id: int,
+        category_id: int,
+        guild_id: int,
+    ) -> tuple[bool, bool]:
+        """
+        🔍 Verifica canal temporário e categoria geradora de uma vez
+
+        Args:
+            channel_id: ID do canal Discord
+            category_id: ID da categoria Discord
+            guild_id: ID do servidor Discord
+
+        Returns:
+            tuple[bool, bool]: (canal é temporário, categoria é geradora)
+
+        Raises:
+            Exception: Erro do banco propaga; a resposta não deve ser cacheada
+        """
+        pass
+
     # ═══════════════════════════════════════════════════════════════
     # 🎓 OPERAÇÕES DE FÓRUNS ÚNICOS POR MEMBRO
     # ═══════════════════════════════════════════════════════════════
@@ -205,3 +205,30 @@ class ChannelRepository(ABC):
             bool: True se canal é temporário e ativo, False caso contrário
         """
         pass
+
+    @abstractmethod
+    async def classify_voice_channel(
+        self,
+        channel_id: int,
+        category_id: int,
+        guild_id: int,
+        category_name: str | None = None,
+    ) -> tuple[bool, bool]:
+        """
+        🔍 Classifica um canal de voz numa única consulta
+
+        💡 Boa Prática: Junta is_temporary_channel e is_temp_room_category!
+
+        Args:
+            channel_id: ID do canal Discord
+            category_id: ID da categoria do canal
+            guild_id: ID do servidor Discord
+            category_name: Nome da categoria (opcional, para logs)
+
+        Returns:
+            tuple[bool, bool]: (canal é temporário, categoria é geradora)
+
+        Raises:
+            Exception: Erro do banco propaga; a resposta não deve ser cacheada
+        """
+        pass
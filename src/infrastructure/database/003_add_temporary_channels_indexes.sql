@@ -0,0 +1,20 @@
+-- ============================================================================
+-- 🔧 Migração: Índices de temporary_channels
+-- ⚡ Performance: Consultas de salas temporárias sem varrer o histórico
+--
+-- Data: 17 de outubro de 2026
+-- Objetivo: Salas removidas ficam na tabela com is_active = 0; a limpeza e o
+-- UPDATE de inativação não devem crescer junto com esse histórico
+-- ============================================================================
+
+-- ============================================================================
+-- 📊 ÍNDICES para Performance
+-- ============================================================================
+
+-- 💡 Parcial: a limpeza no encerramento só busca salas ativas por servidor
+CREATE INDEX IF NOT EXISTS idx_tempch_active_guild
+ON temporary_channels(guild_id) WHERE is_active = 1;
+
+-- 💡 UPDATE de inativação e verificação de sala temporária por canal
+CREATE INDEX IF NOT EXISTS idx_tempch_channel_id
+ON temporary_channels(channel_id);
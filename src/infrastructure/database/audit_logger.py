@@ -18,9 +18,21 @@ import colorlog
 
 from config import AUDIT_DB_PATH
 
+try:
+    import orjson
+except ImportError:  # 💡 Opcional: sem orjson usa o json da stdlib
+    orjson = None
+
 # 💡 Caminho do banco de auditoria importado do config.py centralizado!
 
 
+def _dumps_extra(data: dict[str, Any]) -> str:
+    """🧾 Serializa os dados extras do log (orjson quando disponível)"""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
 class DatabaseLogHandler(logging.Handler):
     """
     🗄️ Handler customizado que salva logs em banco de dados SQLite separado.
@@ -162,7 +174,7 @@ class DatabaseLogHandler(logging.Handler):
                 "module": record.module,
                 "function": record.funcName,
                 "line_number": record.lineno,
-                "extra_data": json.dumps(extra_data) if extra_data else None,
+                "extra_data": _dumps_extra(extra_data) if extra_data else None,
             }
 
             # 📦 Adiciona na fila (não bloqueia!)
@@ -645,6 +645,34 @@ class DiscordChannelRepository(ChannelRepository):
         # 🔗 Delega para o repository de banco de dados
         return await self.category_db.is_temporary_channel(channel_id, guild_id)
 
+    async def classify_voice_channel(
+        self,
+        channel_id: int,
+        category_id: int,
+        guild_id: int,
+        category_name: str | None = None,  # 💖 Nome opcional para logs mais bonitos
+    ) -> tuple[bool, bool]:
+        """
+        🔍 Classifica canal de voz (temporário? categoria geradora?)
+
+        💡 Boa Prática: Delega para o CategoryDatabaseRepository!
+
+        Args:
+            channel_id: ID do canal Discord
+            category_id: ID da categoria do canal
+            guild_id: ID do servidor Discord
+            category_name: Nome da categoria (opcional, para logs)
+
+        Returns:
+            tuple[bool, bool]: (canal é temporário, categoria é geradora)
+        """
+        # 🔗 Delega para o repository de banco de dados
+        return await self.category_db.classify_voice_channel(
+            channel_id,
+            category_id,
+            guild_id,
+        )
+
     # ═══════════════════════════════════════════════════════════════
     # 🏠 GERENCIAMENTO DE FÓRUNS ÚNICOS POR MEMBRO
     # ═══════════════════════════════════════════════════════════════
@@ -234,6 +234,43 @@ class SQLiteCategoryRepository(CategoryDatabaseRepository):
             logger.exception("❌ Erro ao verificar canal temporário")
             return False
 
+    async def classify_voice_channel(
+        self,
+        channel_id: int,
+        category_id: int,
+        guild_id: int,
+    ) -> tuple[bool, bool]:
+        """
+        🔍 Verifica canal temporário e categoria geradora numa só query
+
+        💡 Boa Prática: Uma conexão e um SELECT por evento de voz!
+
+        Raises:
+            aiosqlite.Error: Se a consulta falhar (a resposta não é confiável,
+                então quem chama não deve cacheá-la)
+        """
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute(
+                """
+                SELECT
+                    (SELECT is_active FROM temporary_channels
+                     WHERE channel_id = ? AND guild_id = ?),
+                    (SELECT is_active FROM temp_room_categories
+                     WHERE category_id = ? AND guild_id = ?)
+                """,
+                (channel_id, guild_id, category_id, guild_id),
+            )
+            is_temp, is_generator = await cursor.fetchone()
+
+        logger.debug(
+            "🔍 Canal %s temporário=%s | categoria %s geradora=%s",
+            channel_id,
+            is_temp == 1,
+            category_id,
+            is_generator == 1,
+        )
+        return is_temp == 1, is_generator == 1
+
     # ═══════════════════════════════════════════════════════════════
     # 🎓 OPERAÇÕES DE FÓRUNS ÚNICOS POR MEMBRO
     # ═══════════════════════════════════════════════════════════════
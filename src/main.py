@@ -5,31 +5,99 @@
 
 import asyncio
 import logging
+import os
+import pickle
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import ClassVar
 
 import colorlog
 import discord
 from decouple import config
 from discord.ext import commands
 
-from config import COMMAND_PREFIX
+from config import BOT_STATUS_TEXT, COMMAND_PREFIX
 from infrastructure.database.audit_logger import audit_logger  # noqa: F401
 from infrastructure.database.cleanup_manager import create_cleanup_manager
-from infrastructure.repositories import (
-    DiscordChannelRepository,
-    SQLiteCategoryRepository,
-)
 from manager import CleanArchitectureManager
-from presentation.controllers import ChannelController
+from presentation.controllers import (
+    get_channel_controller,
+    release_channel_controller,
+)
+
+try:
+    import uvloop
+except ImportError:  # 💡 Opcional: sem uvloop usa o loop padrão do asyncio
+    uvloop = None
 
 intents = discord.Intents.default()
 intents.members = True
 intents.message_content = True
-bot = commands.Bot(command_prefix=COMMAND_PREFIX, intents=intents)
+# 💡 Nenhum handler usa "digitando...", presença ou reações: evita
+# decodificar esses eventos (os de maior volume no gateway)
+intents.typing = False
+intents.presences = False
+intents.reactions = False
+# 👀 Status enviado no IDENTIFY: o gateway o reaplica a cada reconexão
+bot = commands.Bot(
+    command_prefix=COMMAND_PREFIX,
+    intents=intents,
+    activity=discord.Activity(
+        type=discord.ActivityType.watching, name=BOT_STATUS_TEXT
+    ),
+)
 
 logger = logging.getLogger(__name__)
 audit = logging.getLogger("audit")
 
+# 📁 Diretório base resolvido uma única vez no import
+_BASE_DIR = Path(__file__).parent
+
+# 📊 Níveis aceitos em LOG_LEVEL
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+def _iter_py(dirpath: Path) -> Iterator[str]:
+    """
+    🔎 Gera o nome dos módulos .py de um diretório (sem __init__)
+
+    💡 Boa Prática: DirEntry já traz o tipo do arquivo, sem stat extra!
+    """
+    with os.scandir(dirpath) as it:
+        for entry in it:
+            if (
+                entry.name.endswith(".py")
+                and entry.name != "__init__.py"
+                and entry.is_file(follow_symlinks=False)
+            ):
+                yield entry.name[:-3]
+
+
+@dataclass(slots=True)
+class ExtensionLoadStatus:
+    """
+    📊 Resultado do carregamento de extensões
+
+    💡 Boa Prática: O texto só é montado quando o log é realmente emitido!
+    """
+
+    loaded: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        total_extensions = len(self.loaded) + len(self.failed)
+        status = f"✅ {len(self.loaded)}/{total_extensions} extensões carregadas"
+        if self.failed:
+            status += f", ❌{len(self.failed)} falharam"
+        return status
+
 
 # 🏗️ Dependency Injection Container
 class DIContainer:
@@ -48,16 +116,10 @@ class DIContainer:
 
         💡 Boa Prática: Dependency Injection com Clean Architecture!
         """
-        # 🔧 STEP 1: Cria repository de banco de dados
-        self.category_db_repository = SQLiteCategoryRepository()
-
-        # 🔧 STEP 2: Injeta no repository Discord
-        self.channel_repository = DiscordChannelRepository(
-            self.bot, self.category_db_repository
-        )
-
-        # 🔧 STEP 3: Cria controller com repository Discord
-        self.channel_controller = ChannelController(self.channel_repository)
+        # 🔧 STEP 1-3: Repository de banco -> repository Discord -> controller
+        # 💡 Montados uma vez por bot: cogs e manager recebem a mesma instância
+        self.channel_controller = get_channel_controller(self.bot)
+        self.channel_repository = self.channel_controller.channel_repository
 
         # 🔧 STEP 4: Cria gerenciador de limpeza de logs com retenção automática
         self.cleanup_manager = create_cleanup_manager()
@@ -69,64 +131,99 @@ class CleanArchitectureBot:
     💡 Boa Prática: Coordena toda aplicação!
     """
 
+    # 🗂️ Cache de módulos por diretório (conteúdo fixo durante a execução)
+    _extension_cache: ClassVar[dict[str, list[str]]] = {}
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.container = DIContainer(bot)
         self.manager = CleanArchitectureManager(bot, self.container.channel_controller)
 
-    async def load_clean_extensions(self) -> str:
-        """Carrega extensões da Clean Architecture"""
-        loaded = []
-        failed = []
-
-        commands_dir = Path(__file__).parent / "application" / "commands"
-        if commands_dir.exists():
-            for file in commands_dir.glob("*.py"):
-                if file.stem == "__init__":
-                    continue
-                try:
-                    await self.bot.load_extension(f"application.commands.{file.stem}")
-                    loaded.append(f"application.commands.{file.stem}")
-                except (ImportError, ModuleNotFoundError, AttributeError) as e:
-                    failed.append(f"application.commands.{file.stem}")
-                    audit.warning(
-                        f"{__name__} | ❌ Falha ao carregar comando: {file.stem}",
-                        extra={"extension": f"application.commands.{file.stem}", "error": str(e)}
-                    )
+    @classmethod
+    def _discover_extensions(cls, subdir: str) -> list[str]:
+        """
+        🔎 Lista os módulos .py de um diretório de extensões
 
-        slash_dir = Path(__file__).parent / "application" / "slash_commands"
-        if slash_dir.exists():
-            for file in slash_dir.glob("*.py"):
-                if file.stem == "__init__":
-                    continue
-                try:
-                    await self.bot.load_extension(
-                        f"application.slash_commands.{file.stem}"
-                    )
-                    loaded.append(f"application.slash_commands.{file.stem}")
-                except (ImportError, ModuleNotFoundError, AttributeError) as e:
-                    failed.append(f"application.slash_commands.{file.stem}")
-                    audit.warning(
-                        f"{__name__} | ❌ Falha ao carregar slash: {file.stem}",
-                        extra={"extension": f"application.slash_commands.{file.stem}", "error": str(e)}
-                    )
+        💡 Boa Prática: os.scandir reaproveita o stat da entrada e o
+        resultado fica em cache para retries não varrerem o disco de novo!
+        """
+        cached = cls._extension_cache.get(subdir)
+        if cached is not None:
+            return cached
 
-        clean_commands_file = Path(__file__).parent / "clean_commands.py"
-        if clean_commands_file.exists():
+        try:
+            stems = sorted(_iter_py(_BASE_DIR / subdir))
+        except FileNotFoundError:
+            stems = []
+
+        cls._extension_cache[subdir] = stems
+        return stems
+
+    async def _load_extension(self, name: str) -> None:
+        """
+        📦 Carrega a extensão ou recarrega se ela já estiver ativa
+
+        💡 Boa Prática: Evita ExtensionAlreadyLoaded em retries e
+        reaproveita o ciclo de vida gerenciado pelo discord.py!
+        """
+        if name in self.bot.extensions:
+            await self.bot.reload_extension(name)
+        else:
+            await self.bot.load_extension(name)
+
+    async def _load_package(
+        self, package: str, label: str, status: ExtensionLoadStatus
+    ) -> None:
+        """
+        📦 Carrega todas as extensões de um pacote
+
+        Args:
+            package: Pacote pontuado (ex: "application.commands")
+            label: Nome usado no log de falha (ex: "comando")
+            status: Acumulador de extensões carregadas/falhas
+        """
+        for stem in self._discover_extensions(package.replace(".", "/")):
+            name = f"{package}.{stem}"
             try:
-                await self.bot.load_extension("clean_commands")
-                loaded.append("clean_commands")
-            except (ImportError, ModuleNotFoundError, AttributeError) as e:
-                failed.append("clean_commands")
+                await self._load_extension(name)
+                status.loaded.append(name)
+            except (ImportError, AttributeError, commands.ExtensionError) as e:
+                status.failed.append(name)
                 audit.warning(
-                    f"{__name__} | ❌ Falha ao carregar clean_commands",
-                    extra={"extension": "clean_commands", "error": str(e)}
+                    f"{__name__} | ❌ Falha ao carregar {label}: {stem}",
+                    extra={"extension": name, "error": str(e)}
                 )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Traceback de %s", stem, exc_info=e)
 
-        total_extensions = len(loaded) + len(failed)
-        status = f"✅ {len(loaded)}/{total_extensions} extensões carregadas"
-        if failed:
-            status += f", ❌{len(failed)} falharam"
+    async def _load_clean_commands(self, status: ExtensionLoadStatus) -> None:
+        """🧩 Carrega o módulo opcional clean_commands"""
+        try:
+            await self._load_extension("clean_commands")
+            status.loaded.append("clean_commands")
+        except commands.ExtensionNotFound:
+            # 💡 Módulo opcional: ausência não conta como falha
+            logger.debug("clean_commands não encontrado, ignorando")
+        except (ImportError, AttributeError, commands.ExtensionError) as e:
+            status.failed.append("clean_commands")
+            audit.warning(
+                f"{__name__} | ❌ Falha ao carregar clean_commands",
+                extra={"extension": "clean_commands", "error": str(e)}
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Traceback de clean_commands", exc_info=e)
+
+    async def load_clean_extensions(self) -> ExtensionLoadStatus:
+        """
+        Carrega extensões da Clean Architecture
+
+        💡 Boa Prática: Em sequência - a ordem de carga é sempre a mesma!
+        """
+        status = ExtensionLoadStatus()
+
+        await self._load_package("application.commands", "comando", status)
+        await self._load_package("application.slash_commands", "slash", status)
+        await self._load_clean_commands(status)
 
         return status
 
@@ -134,7 +231,7 @@ class CleanArchitectureBot:
 def setup_logging() -> None:
     """📝 Configura logging da aplicação com cores lindas 🌈"""
     level_name = config("LOG_LEVEL", default="INFO").upper()
-    level = getattr(logging, level_name, logging.INFO)
+    level = _LEVELS.get(level_name, logging.INFO)
 
     # 🎨 Configura handler com cores
     handler = colorlog.StreamHandler()
@@ -171,16 +268,12 @@ async def cleanup_temp_rooms() -> None:
         extra={"action": "cleanup_on_shutdown"},
     )
 
-    try:
-        from manager import create_manager
-
-        manager = create_manager(bot)
+    channel_controller = get_channel_controller(bot)
 
+    try:
         for guild in bot.guilds:
             try:
-                removed = (
-                    await manager.channel_controller.cleanup_all_temp_channels(guild)
-                )
+                removed = await channel_controller.cleanup_all_temp_channels(guild)
                 if removed > 0:
                     audit.info(
                         f"{__name__} | 🧹 {removed} salas removidas do servidor {guild.name}",
@@ -208,6 +301,9 @@ async def cleanup_temp_rooms() -> None:
             f"{__name__} | ⚠️ Erro crítico durante limpeza de salas temporárias",
             extra={"action": "cleanup_on_shutdown"},
         )
+    finally:
+        # 🔌 Fecha a conexão SQLite e descarta o controller compartilhado
+        await release_channel_controller(bot)
 
 
 async def start() -> None:
@@ -233,7 +329,7 @@ async def start() -> None:
     async with bot:
         clean_bot = CleanArchitectureBot(bot)
         status = await clean_bot.load_clean_extensions()
-        audit.info(f"{__name__} | {status}")
+        audit.info("%s | %s", __name__, status)
 
         # 🔧 STEP 2: Inicia o gerenciador de limpeza de logs
         cleanup_task = asyncio.create_task(
@@ -279,7 +375,9 @@ async def start() -> None:
 def main() -> None:
     """🎯 Ponto de entrada principal"""
     try:
-        asyncio.run(start())
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(start())
 
     except KeyboardInterrupt:
         audit.info(
@@ -305,17 +403,17 @@ def main() -> None:
             extra={"error_type": "FileNotFoundError"},
         )
 
+    except pickle.PickleError as e:
+        audit.error(
+            f"{__name__} | 🔴 Arquivo corrompido detectado",
+            extra={"error_type": "PickleError", "error_detail": str(e)},
+        )
+
     except Exception as e:
-        if "pickle" in str(e).lower():
-            audit.error(
-                f"{__name__} | 🔴 Arquivo corrompido detectado",
-                extra={"error_type": "PickleError", "error_detail": str(e)},
-            )
-        else:
-            audit.critical(
-                f"{__name__} | 🔴 Erro inesperado na aplicação",
-                extra={"error_type": type(e).__name__, "error_detail": str(e)},
-            )
+        audit.critical(
+            f"{__name__} | 🔴 Erro inesperado na aplicação",
+            extra={"error_type": type(e).__name__, "error_detail": str(e)},
+        )
 
     finally:
         audit.info(
@@ -3,143 +3,394 @@
 💡 Boa Prática: Manager centralizado apenas para coordenação e eventos!
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import time
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
 
 import discord
+from discord import Forbidden, app_commands
 from discord.ext import commands
+from discord.ext.commands import errors
 
-from config import BOT_STATUS_TEXT
-from presentation.controllers import ChannelController
+from config import COMMAND_TREE_HASH_PATH
+from presentation.controllers import ChannelController, get_channel_controller
 
 logger = logging.getLogger(__name__)
 audit = logging.getLogger("audit")
 
+# 💬 Respostas de erro de comando
+ERROR_COALESCE_WINDOW = 2.0  # Ignora o mesmo erro repetido pelo mesmo usuário (segundos)
+ERROR_COALESCE_MAX_USERS = 1024  # Entradas antes de podar a janela
+ERROR_MESSAGE_TTL = 5.0  # Tempo de vida das respostas de erro (segundos)
+ERROR_SWEEP_INTERVAL = 2.0  # Intervalo da varredura que apaga as respostas
+ERROR_SWEEP_MAXLEN = 1024  # Respostas pendentes antes de cair no delete_after
+
+# 🏷️ Campos fixos dos registros de auditoria do BotErrorHandler
+# 💡 Nada de nomes reservados do LogRecord ("module", "lineno"...) no extra:
+# o logging levanta KeyError ao tentar sobrescrevê-los
+_AUDIT_BASE = {"component": "manager.BotErrorHandler"}
+
+# 🗂️ Assinaturas dos handlers das tabelas de erros (prefixo e slash)
+CommandErrorHandler = Callable[[commands.Context, Exception], Awaitable[None]]
+AppCommandErrorHandler = Callable[
+    [discord.Interaction, Exception, str], Awaitable[None]
+]
+
+# 🗑️ Deleção em lote das mensagens de comando
+DELETE_FLUSH_INTERVAL = 0.5  # Janela de acúmulo antes do bulk delete (segundos)
+DELETE_FLUSH_THRESHOLD = 10  # Mensagens num canal que disparam o flush na hora
+BULK_DELETE_LIMIT = 100  # Máximo de mensagens por requisição de bulk delete
+BULK_DELETE_MAX_AGE = timedelta(days=14)  # Bulk delete rejeita mensagens mais antigas
+DELETE_CONCURRENCY = 16  # Canais deletando em paralelo
+
+
+def _replace_listener(
+    bot: commands.Bot, func: Callable[..., Awaitable[None]], name: str
+) -> None:
+    """
+    🔁 Registra um listener removendo o mesmo método de instâncias anteriores
+
+    💡 Boa Prática: Recriar o manager não acumula listeners duplicados!
+    """
+    for existing in list(bot.extra_events.get(name, ())):
+        if getattr(existing, "__func__", None) is func.__func__:
+            bot.remove_listener(existing, name)
+    bot.add_listener(func, name)
+
 
 class BotErrorHandler:
     """
     ❌ Centraliza todo tratamento de erros da aplicação
     """
 
+    __slots__ = (
+        "_app_error_table",
+        "_audit_log",
+        "_cmd_error_table",
+        "_extras_cache",
+        "_pending_delete",
+        "_recent_errors",
+        "_sweep_task",
+        "bot",
+    )
+
+    # 💬 Templates das respostas de erro (um único slot por chamada)
+    _TPL_NO_PERM = "❌ {mention}, você não tem permissão para usar este comando! 🔒"
+    _TPL_COOLDOWN = "⏰ {mention}, aguarde {retry_after:.1f}s antes de usar novamente! 💤"
+    _TPL_MISSING_ARG = "❌ {mention}, argumento obrigatório em falta: `{param}`"
+    _TPL_BOT_FORBIDDEN = "❌ {mention}, o bot não tem permissões suficientes!"
+    _TPL_UNEXPECTED = "❌ {mention}, ocorreu um erro inesperado! Tente novamente."
+
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
+        # 🏷️ Campos fixos vinculados uma vez; extras da chamada são mesclados
+        self._audit_log = logging.LoggerAdapter(audit, _AUDIT_BASE, merge_extra=True)
+        # 🗂️ Tipo do erro -> handler (subclasses entram sob demanda)
+        self._cmd_error_table: dict[type[Exception], CommandErrorHandler] = {
+            errors.MissingPermissions: self._on_missing_permissions,
+            errors.CommandOnCooldown: self._on_cooldown,
+            errors.MissingRequiredArgument: self._on_missing_argument,
+            Forbidden: self._on_bot_forbidden,
+        }
+        self._app_error_table: dict[type[Exception], AppCommandErrorHandler] = {
+            app_commands.MissingPermissions: self._on_app_missing_permissions,
+            app_commands.CommandOnCooldown: self._on_app_cooldown,
+        }
+        # 🏷️ Campos estáticos de auditoria por tipo de erro
+        self._extras_cache: dict[type[Exception], dict[str, str]] = {}
+        # ⏱️ Última resposta por (usuário, template de erro) (monotonic)
+        self._recent_errors: dict[tuple[int, str], float] = {}
+        # 🧹 Respostas de erro aguardando deleção (mensagem, prazo monotonic)
+        self._pending_delete: deque[tuple[discord.Message, float]] = deque(
+            maxlen=ERROR_SWEEP_MAXLEN
+        )
+        self._sweep_task: asyncio.Task | None = None
         self._setup_error_handlers()
 
-    def _setup_error_handlers(self) -> None:
+    def _extras_for(self, error: Exception) -> dict[str, str]:
         """
-        ⚙️ Configura todos os tratadores de erro do bot
+        🏷️ Retorna os campos fixos de auditoria para o tipo do erro
+
+        💡 Boa Prática: Um dict por classe de erro, reaproveitado sempre!
+        """
+        error_type = type(error)
+        extras = self._extras_cache.get(error_type)
+        if extras is None:
+            extras = {"error_type": error_type.__name__}
+            self._extras_cache[error_type] = extras
+        return extras
+
+    def _audit(self, level: int, msg: str, extra: dict) -> None:
         """
+        📨 Emite um registro de auditoria
 
-        @self.bot.event
-        async def on_command_error(ctx: commands.Context, error: Exception) -> None:
-            """❌ Tratamento global de erros de comandos com prefixo"""
-            await self._handle_command_error(ctx, error)
+        💡 Boa Prática: O logger "audit" já entrega tudo a um QueueHandler,
+        então a chamada não bloqueia o event loop!
+        """
+        # 💡 stacklevel=2: função/linha gravadas são as do handler chamador
+        self._audit_log.log(level, msg, extra=extra, stacklevel=2)
 
-        @self.bot.event
-        async def on_app_command_error(
-            interaction: discord.Interaction, error: Exception
-        ) -> None:
-            """❌ Tratamento de erros para slash commands"""
-            await self._handle_app_command_error(interaction, error)
+    def _setup_error_handlers(self) -> None:
+        """
+        ⚙️ Configura todos os tratadores de erro do bot
+
+        💡 Boa Prática: Métodos ligados registrados direto, sem closures!
+        """
+        _replace_listener(self.bot, self._handle_command_error, "on_command_error")
+        # 💡 Erros de slash commands chegam em CommandTree.on_error
+        self.bot.tree.error(self._handle_app_command_error)
 
     async def _handle_command_error(
         self, ctx: commands.Context, error: Exception
     ) -> None:
         """
         🔧 Trata erros de comandos tradicionais com mensagens amigáveis
+
+        💡 Boa Prática: Tabela por tipo em vez de cadeia de isinstance!
         """
-        from discord import Forbidden
-        from discord.ext.commands import errors
+        error_type = type(error)
+        if error_type is errors.CommandNotFound:
+            return
+        if error_type is errors.CommandInvokeError:
+            # 💡 Exceções do comando (ex.: Forbidden) chegam embrulhadas
+            error = error.original
+            error_type = type(error)
+
+        handler = self._cmd_error_table.get(error_type)
+        if handler is None:
+            # 💡 Subclasses resolvidas uma vez e memorizadas na tabela
+            handler = next(
+                (
+                    candidate
+                    for base, candidate in self._cmd_error_table.items()
+                    if isinstance(error, base)
+                ),
+                self._on_unexpected_error,
+            )
+            self._cmd_error_table[error_type] = handler
 
-        full_command = (
+        await handler(ctx, error)
+
+    def _full_command(self, ctx: commands.Context) -> str:
+        """🏷️ Nome completo do comando (montado só quando vai ser logado)"""
+        return (
             f"{self.bot.command_prefix}{ctx.command.name}"
             if ctx.command
             else "Comando desconhecido"
         )
 
-        if isinstance(error, errors.CommandNotFound):
+    async def _send_error(
+        self, ctx: commands.Context, template: str, **fields: object
+    ) -> None:
+        """
+        💬 Responde um erro de comando gastando o mínimo de requisições
+
+        💡 Com manage_messages as respostas são apagadas em lote pela
+        varredura; sem ela, cada uma usa o delete_after do discord.py.
+        O mesmo erro repetido pelo mesmo usuário dentro da janela é ignorado.
+        """
+        now = time.monotonic()
+        key = (ctx.author.id, template)
+        last = self._recent_errors.get(key)
+        if last is not None and now - last < ERROR_COALESCE_WINDOW:
+            return
+        self._recent_errors[key] = now
+        if len(self._recent_errors) > ERROR_COALESCE_MAX_USERS:
+            self._recent_errors = {
+                k: ts
+                for k, ts in self._recent_errors.items()
+                if now - ts < ERROR_COALESCE_WINDOW
+            }
+
+        text = template.format_map({"mention": ctx.author.mention, **fields})
+        # 💡 Bulk delete exige manage_messages; apagar a própria mensagem, não
+        # (fila cheia também cai no timer, sem descartar prazos antigos)
+        if (
+            not ctx.channel.permissions_for(ctx.me).manage_messages
+            or len(self._pending_delete) >= ERROR_SWEEP_MAXLEN
+        ):
+            await ctx.send(text, delete_after=ERROR_MESSAGE_TTL)
             return
+        sent = await ctx.send(text)
+        self._schedule_delete(sent, now + ERROR_MESSAGE_TTL)
 
-        if isinstance(error, errors.MissingPermissions):
-            audit.warning(
-                f"{__name__} | 🔐 Tentativa de uso de comando sem permissão",
-                extra={
-                    "command": full_command,
-                    "user_id": ctx.author.id,
-                    "module": "manager.BotErrorHandler",
-                },
-            )
-            await ctx.send(
-                f"❌ {ctx.author.mention}, você não tem permissão para usar este comando! 🔒",
-                delete_after=5,
-            )
+    def _schedule_delete(self, message: discord.Message, deadline: float) -> None:
+        """
+        🧹 Agenda a deleção de uma resposta de erro
 
-        elif isinstance(error, errors.CommandOnCooldown):
-            await ctx.send(
-                f"⏰ {ctx.author.mention}, aguarde {error.retry_after:.1f}s antes de usar novamente! 💤",
-                delete_after=5,
-            )
+        💡 Boa Prática: Uma única task varre todas as respostas, em vez de
+        uma task e um DELETE por erro!
+        """
+        self._pending_delete.append((message, deadline))
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_error_messages())
 
-        elif isinstance(error, errors.MissingRequiredArgument):
-            await ctx.send(
-                f"❌ {ctx.author.mention}, argumento obrigatório em falta: `{error.param.name}`",
-                delete_after=5,
-            )
+    async def _sweep_error_messages(self) -> None:
+        """
+        🔄 Apaga em lote as respostas de erro vencidas, por canal
+        """
+        while self._pending_delete:
+            await asyncio.sleep(ERROR_SWEEP_INTERVAL)
+            if self.bot.is_closed():
+                self._pending_delete.clear()
+                return
 
-        elif isinstance(error, Forbidden):
-            audit.warning(
-                f"{__name__} | 🔐 Bot sem permissões suficientes",
-                extra={"command": full_command, "module": "manager.BotErrorHandler"},
-            )
-            await ctx.send(
-                f"❌ {ctx.author.mention}, o bot não tem permissões suficientes!",
-                delete_after=5,
-            )
+            # 💡 Prazos crescentes: as vencidas estão sempre no início da fila
+            now = time.monotonic()
+            expired: defaultdict[int, list[discord.Message]] = defaultdict(list)
+            while self._pending_delete and self._pending_delete[0][1] <= now:
+                message, _ = self._pending_delete.popleft()
+                expired[message.channel.id].append(message)
 
-        else:
-            audit.error(
-                f"{__name__} | ⚠️ Erro inesperado no comando: {full_command}",
-                extra={"command": full_command, "error_type": type(error).__name__},
-            )
-            await ctx.send(
-                f"❌ {ctx.author.mention}, ocorreu um erro inesperado! Tente novamente.",
-                delete_after=5,
-            )
+            for messages in expired.values():
+                channel = messages[0].channel
+                try:
+                    for i in range(0, len(messages), BULK_DELETE_LIMIT):
+                        await channel.delete_messages(
+                            messages[i : i + BULK_DELETE_LIMIT]
+                        )
+                except (discord.Forbidden, discord.NotFound):
+                    pass
+                except discord.HTTPException:
+                    logger.warning(
+                        "⚠️ Falha ao apagar respostas de erro", exc_info=True
+                    )
+
+    async def _on_missing_permissions(
+        self, ctx: commands.Context, error: Exception
+    ) -> None:
+        """🔐 Usuário sem permissão para o comando"""
+        self._audit(
+            logging.WARNING,
+            f"{__name__} | 🔐 Tentativa de uso de comando sem permissão",
+            {
+                **self._extras_for(error),
+                "command": self._full_command(ctx),
+                "user_id": ctx.author.id,
+            },
+        )
+        await self._send_error(ctx, self._TPL_NO_PERM)
+
+    async def _on_cooldown(
+        self, ctx: commands.Context, error: Exception
+    ) -> None:
+        """⏰ Comando em cooldown"""
+        await self._send_error(ctx, self._TPL_COOLDOWN, retry_after=error.retry_after)
+
+    async def _on_missing_argument(
+        self, ctx: commands.Context, error: Exception
+    ) -> None:
+        """❌ Argumento obrigatório ausente"""
+        await self._send_error(ctx, self._TPL_MISSING_ARG, param=error.param.name)
+
+    async def _on_bot_forbidden(
+        self, ctx: commands.Context, error: Exception
+    ) -> None:
+        """🔐 Bot sem permissões no Discord"""
+        self._audit(
+            logging.WARNING,
+            f"{__name__} | 🔐 Bot sem permissões suficientes",
+            {
+                **self._extras_for(error),
+                "command": self._full_command(ctx),
+                # 💡 Código numérico do Discord (50013 = Missing Permissions)
+                "discord_code": error.code,
+            },
+        )
+        await self._send_error(ctx, self._TPL_BOT_FORBIDDEN)
+
+    async def _on_unexpected_error(
+        self, ctx: commands.Context, error: Exception
+    ) -> None:
+        """⚠️ Qualquer outro erro"""
+        full_command = self._full_command(ctx)
+        self._audit(
+            logging.ERROR,
+            f"{__name__} | ⚠️ Erro inesperado no comando: {full_command}",
+            {**self._extras_for(error), "command": full_command},
+        )
+        # 💡 Traceback só é formatado se algum handler for consumir o registro
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Erro inesperado no comando %s", full_command, exc_info=error)
+        await self._send_error(ctx, self._TPL_UNEXPECTED)
 
     async def _handle_app_command_error(
         self, interaction: discord.Interaction, error: Exception
     ) -> None:
         """
         ⚡ Trata erros de slash commands com respostas ephemeral
+
+        💡 Boa Prática: Mesma tabela por tipo usada nos comandos com prefixo!
         """
-        from discord import app_commands
+        error_type = type(error)
+        handler = self._app_error_table.get(error_type)
+        if handler is None:
+            handler = next(
+                (
+                    candidate
+                    for base, candidate in self._app_error_table.items()
+                    if isinstance(error, base)
+                ),
+                self._on_app_unexpected_error,
+            )
+            self._app_error_table[error_type] = handler
 
         command_name = (
             interaction.command.name if interaction.command else "Comando desconhecido"
         )
+        await handler(interaction, error, command_name)
 
-        if isinstance(error, app_commands.MissingPermissions):
-            audit.warning(
-                f"{__name__} | 🔐 Slash command sem permissão",
-                extra={"command": command_name, "module": "manager.BotErrorHandler"},
-            )
-            await interaction.response.send_message(
-                "❌ Você não tem permissão para usar este comando.", ephemeral=True
-            )
+    @staticmethod
+    async def _send_app_error(interaction: discord.Interaction, text: str) -> None:
+        """💬 Responde ephemeral, usando followup se a interação já foi respondida"""
+        if interaction.response.is_done():
+            await interaction.followup.send(text, ephemeral=True)
+        else:
+            await interaction.response.send_message(text, ephemeral=True)
 
-        elif isinstance(error, app_commands.CommandOnCooldown):
-            await interaction.response.send_message(
-                f"⏰ Comando em cooldown. Tente novamente em {int(error.retry_after)} segundos.",
-                ephemeral=True,
-            )
+    async def _on_app_missing_permissions(
+        self, interaction: discord.Interaction, error: Exception, command_name: str
+    ) -> None:
+        """🔐 Usuário sem permissão para o slash command"""
+        self._audit(
+            logging.WARNING,
+            f"{__name__} | 🔐 Slash command sem permissão",
+            {**self._extras_for(error), "command": command_name},
+        )
+        await self._send_app_error(
+            interaction, "❌ Você não tem permissão para usar este comando."
+        )
 
-        else:
-            audit.error(
-                f"{__name__} | ⚠️ Erro inesperado no slash command: {command_name}",
-                extra={"command": command_name, "error_type": type(error).__name__},
-            )
-            await interaction.response.send_message(
-                "❌ Ocorreu um erro inesperado ao executar o comando.", ephemeral=True
+    async def _on_app_cooldown(
+        self, interaction: discord.Interaction, error: Exception, command_name: str
+    ) -> None:
+        """⏰ Slash command em cooldown"""
+        await self._send_app_error(
+            interaction,
+            f"⏰ Comando em cooldown. Tente novamente em {int(error.retry_after)} segundos.",
+        )
+
+    async def _on_app_unexpected_error(
+        self, interaction: discord.Interaction, error: Exception, command_name: str
+    ) -> None:
+        """⚠️ Qualquer outro erro de slash command"""
+        self._audit(
+            logging.ERROR,
+            f"{__name__} | ⚠️ Erro inesperado no slash command: {command_name}",
+            {**self._extras_for(error), "command": command_name},
+        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Erro inesperado no slash command %s", command_name, exc_info=error
             )
+        await self._send_app_error(
+            interaction, "❌ Ocorreu um erro inesperado ao executar o comando."
+        )
 
 
 class CleanArchitectureManager:
@@ -147,33 +398,212 @@ class CleanArchitectureManager:
     🏗️ Manager Principal - Apenas Coordenação e Eventos
     """
 
+    # 💡 Atributos fixos: acesso por slot no caminho quente do on_message
+    __slots__ = (
+        "_bot_user_id",
+        "_delete_buffer",
+        "_delete_inflight",
+        "_delete_sem",
+        "_delete_task",
+        "_prefix",
+        "_prefix_heads",
+        "_ready_once",
+        "_synced",
+        "bot",
+        "channel_controller",
+        "error_handler",
+    )
+
     def __init__(
         self, bot: commands.Bot, channel_controller: ChannelController
     ) -> None:
         self.bot = bot
         self.channel_controller = channel_controller
         self.error_handler = BotErrorHandler(bot)
+        # 🔄 on_ready dispara de novo a cada reconexão; sync só na primeira
+        self._synced = False
+        # ⚡ Prefixo resolvido uma vez para o caminho quente do on_message
+        self._prefix = self._resolve_prefix()
+        self._prefix_heads = self._resolve_prefix_heads()
+        self._bot_user_id: int | None = None
+        # 🔄 Primeiro on_ready do processo já tratado (os demais são reconexões)
+        self._ready_once = False
+        # 🗑️ Mensagens de comando aguardando deleção, por canal
+        self._delete_buffer: defaultdict[int, list[discord.Message]] = defaultdict(
+            list
+        )
+        self._delete_task: asyncio.Task | None = None
+        # 📌 Flushes antecipados em andamento (referência evita coleta da task)
+        self._delete_inflight: set[asyncio.Task] = set()
+        self._delete_sem = asyncio.Semaphore(DELETE_CONCURRENCY)
         self._setup_events()
 
+    def _resolve_prefix(self) -> str | tuple[str, ...] | None:
+        """
+        🔤 Resolve o prefixo estático do bot
+
+        Returns:
+            str ou tupla de prefixos, ou None se o prefixo for dinâmico
+        """
+        prefix = self.bot.command_prefix
+        if isinstance(prefix, str | tuple):
+            return prefix
+        if isinstance(prefix, list):
+            return tuple(prefix)
+        return None
+
+    def _resolve_prefix_heads(self) -> frozenset[str] | None:
+        """
+        🔤 Primeiros caracteres dos prefixos estáticos
+
+        Returns:
+            Conjunto de caracteres, ou None se não der para filtrar
+            (prefixo dinâmico ou vazio)
+        """
+        prefix = self._prefix
+        if prefix is None:
+            return None
+        prefixes = (prefix,) if isinstance(prefix, str) else prefix
+        if not all(prefixes):
+            return None
+        return frozenset(p[0] for p in prefixes)
+
+    def _queue_delete(self, message: discord.Message) -> None:
+        """
+        🗑️ Agenda a deleção de uma mensagem de comando
+
+        💡 Boa Prática: Agrupa deleções num único bulk delete por canal!
+        """
+        channel_id = message.channel.id
+        pending = self._delete_buffer[channel_id]
+        pending.append(message)
+
+        # ⚡ Canal movimentado: não espera a janela, apaga o lote já
+        if len(pending) >= DELETE_FLUSH_THRESHOLD:
+            del self._delete_buffer[channel_id]
+            task = asyncio.create_task(self._delete_messages(pending))
+            self._delete_inflight.add(task)
+            task.add_done_callback(self._delete_inflight.discard)
+            return
+
+        if self._delete_task is None or self._delete_task.done():
+            self._delete_task = asyncio.create_task(self._flush_deletes())
+
+    async def _flush_deletes(self) -> None:
+        """
+        🔄 Esvazia o buffer de deleções a cada janela
+        """
+        while self._delete_buffer:
+            await asyncio.sleep(DELETE_FLUSH_INTERVAL)
+            buffer, self._delete_buffer = self._delete_buffer, defaultdict(list)
+            async with asyncio.TaskGroup() as tg:
+                for messages in buffer.values():
+                    tg.create_task(self._delete_messages(messages))
+
+    async def _delete_messages(self, messages: list[discord.Message]) -> None:
+        """
+        🧹 Deleta as mensagens de um canal em lotes de até 100
+        """
+        # Verifica se o bot ainda tá conectado antes de deletar
+        if self.bot.is_closed():
+            return
+
+        channel = messages[0].channel
+        cutoff = discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+        recent = [m for m in messages if m.created_at > cutoff]
+        old = [m for m in messages if m.created_at <= cutoff]
+
+        try:
+            async with self._delete_sem:
+                for i in range(0, len(recent), BULK_DELETE_LIMIT):
+                    # 💡 delete_messages já usa DELETE simples para uma mensagem só
+                    await channel.delete_messages(recent[i : i + BULK_DELETE_LIMIT])
+                for message in old:
+                    await message.delete()
+        except discord.Forbidden:
+            audit.warning(
+                "🔐 Sem permissão para deletar mensagem de comando no servidor %s",
+                channel.guild.name,
+            )
+        except discord.NotFound:
+            pass
+        except discord.HTTPException:
+            logger.warning("⚠️ Falha ao deletar mensagens de comando", exc_info=True)
+        except RuntimeError as e:
+            # Session fechada durante shutdown - ignora graciosamente
+            if "Session is closed" in str(e):
+                logger.debug("⏹️ Bot desligando, ignorando deleção de mensagem")
+            else:
+                raise
+
+    def _command_tree_digest(self) -> str:
+        """
+        🔁 Calcula o hash da árvore de slash commands registrada
+        """
+        tree = self.bot.tree
+        payload = {
+            "application_id": self.bot.application_id,
+            "commands": [command.to_dict(tree) for command in tree.get_commands()],
+        }
+        data = json.dumps(payload, sort_keys=True).encode()
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    async def _sync_command_tree(self) -> None:
+        """
+        🔄 Sincroniza os slash commands apenas se a árvore mudou
+
+        💡 Boa Prática: tree.sync() é uma chamada HTTP com rate limit;
+        o hash persistido evita repeti-la a cada restart!
+        """
+        digest = self._command_tree_digest()
+        # 💡 Leitura/escrita de disco fora do event loop
+        try:
+            stored = (
+                await asyncio.to_thread(
+                    COMMAND_TREE_HASH_PATH.read_text, encoding="utf-8"
+                )
+            ).strip()
+        except OSError:
+            stored = None
+
+        if digest == stored:
+            logger.debug("🔁 Árvore de comandos inalterada, sync ignorado")
+            return
+
+        await self.bot.tree.sync()
+
+        try:
+            await asyncio.to_thread(
+                COMMAND_TREE_HASH_PATH.write_text, digest, encoding="utf-8"
+            )
+        except OSError:
+            logger.warning("⚠️ Não foi possível salvar o hash da árvore de comandos")
+
     def _setup_events(self) -> None:
         """
         📝 Configura eventos essenciais do bot
         """
+        _replace_listener(self.bot, self._on_ready, "on_ready")
 
-        @self.bot.event
-        async def on_ready() -> None:
-            """✅ Bot conectado e configurado"""
+        # 💡 Sem message_content o texto chega vazio e o prefixo nunca casa
+        intents = self.bot.intents
+        if intents.message_content and intents.guild_messages:
+            _replace_listener(self.bot, self._on_message, "on_message")
 
-            activity = discord.Activity(
-                type=discord.ActivityType.watching, name=BOT_STATUS_TEXT
-            )
-            await self.bot.change_presence(activity=activity)
+    async def _on_ready(self) -> None:
+        """
+        ✅ Bot conectado e configurado
 
-            try:
-                await self.bot.tree.sync()
-            except (discord.HTTPException, discord.Forbidden):
-                logger.exception("❌ Erro ao sincronizar comandos slash")
-            
+        💡 O status vai no IDENTIFY (activity= do Bot), então reconexões
+        não precisam de change_presence!
+        """
+        if self._ready_once:
+            logger.info("🔄 Reconectado ao gateway")
+        else:
+            self._ready_once = True
+            self._prefix = self._resolve_prefix()
+            self._prefix_heads = self._resolve_prefix_heads()
+            self._bot_user_id = self.bot.user.id
             audit.info(
                 f"{__name__} | 🤖 Bot conectado: %s (ID: %s) | Servidores: %d",
                 self.bot.user.name,
@@ -181,47 +611,54 @@ class CleanArchitectureManager:
                 len(self.bot.guilds),
             )
 
-        @self.bot.event
-        async def on_message(message: discord.Message) -> None:
-            """
-            📝 Processa mensagens do chat
-            """
-            if message.author == self.bot.user:
-                return
+        # 💡 Só tenta de novo numa reconexão se o primeiro sync falhou
+        if not self._synced:
+            try:
+                await self._sync_command_tree()
+            except (discord.HTTPException, discord.Forbidden):
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.exception("❌ Erro ao sincronizar comandos slash")
+            else:
+                self._synced = True
 
-            await self.bot.process_commands(message)
+    async def _on_message(self, message: discord.Message) -> None:
+        """
+        📝 Processa mensagens do chat
 
-            if message.content.startswith(self.bot.command_prefix):
-                try:
-                    # Verifica se o bot ainda tá conectado antes de deletar
-                    if not self.bot.is_closed():
-                        await message.delete()
-                except discord.Forbidden:
-                    audit.warning(
-                        "🔐 Sem permissão para deletar mensagem de comando no servidor %s",
-                        message.guild.name if message.guild else "DM"
-                    )
-                except discord.NotFound:
-                    pass
-                except RuntimeError as e:
-                    # Session fechada durante shutdown - ignora graciosamente
-                    if "Session is closed" in str(e):
-                        logger.debug("⏹️ Bot desligando, ignorando deleção de mensagem")
-                    else:
-                        raise
+        💡 Os comandos já são processados pelo Bot.on_message padrão,
+        este listener só agenda a limpeza das mensagens de comando!
+        """
+        content = message.content
+        # ⚡ Só imagem/embed/sticker: nada a comparar com o prefixo
+        if not content:
+            return
+
+        # ⚡ Um caractere descarta quase toda conversa antes do startswith
+        heads = self._prefix_heads
+        if heads is not None and content[0] not in heads:
+            return
+
+        prefix = self._prefix
+        if prefix is None:
+            # 🔄 Prefixo dinâmico: resolve pelo caminho genérico do discord.py
+            prefix = await self.bot.get_prefix(message)
+            if isinstance(prefix, list):
+                prefix = tuple(prefix)
+
+        if not content.startswith(prefix):
+            return
+
+        # 💡 Em DM o bot não pode apagar mensagens de outros usuários
+        if message.guild is None or message.author.id == self._bot_user_id:
+            return
+
+        self._queue_delete(message)
 
 
 def create_manager(bot: commands.Bot) -> CleanArchitectureManager:
     """
     🏭 Factory function para criar o manager
-    """
-    from infrastructure.repositories import (
-        DiscordChannelRepository,
-        SQLiteCategoryRepository,
-    )
 
-    category_db_repository = SQLiteCategoryRepository()
-    channel_repository = DiscordChannelRepository(bot, category_db_repository)
-    channel_controller = ChannelController(channel_repository)
-
-    return CleanArchitectureManager(bot, channel_controller)
+    💡 Boa Prática: Repositories e controller são reaproveitados entre chamadas!
+    """
+    return CleanArchitectureManager(bot, get_channel_controller(bot))
@@ -3,10 +3,39 @@ Controllers - Presentation Layer
 Boa Prática: Camada que coordena UI com aplicação!
 """
 
-from .bot_controller import BotController
-from .channel_controller import ChannelController
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .bot_controller import BotController
+    from .channel_controller import (
+        ChannelController,
+        get_channel_controller,
+        release_channel_controller,
+    )
+
+# 💡 Import preguiçoso (PEP 562): cada controller só é carregado no primeiro uso
+_LAZY_EXPORTS = {
+    "BotController": ".bot_controller",
+    "ChannelController": ".channel_controller",
+    "get_channel_controller": ".channel_controller",
+    "release_channel_controller": ".channel_controller",
+}
 
 __all__ = [
     "BotController",
     "ChannelController",
+    "get_channel_controller",
+    "release_channel_controller",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import time
 from typing import TYPE_CHECKING
 
+import aiosqlite
 import discord
 
 if TYPE_CHECKING:
@@ -14,13 +17,84 @@ from application.use_cases import (
     CreateChannelUseCase,
     CreateForumUseCase,
 )
-from config import DB_PATH
+from config import (
+    DATABASE_BUSY_TIMEOUT,
+    DATABASE_CACHE_SIZE,
+    DB_PATH,
+    TEMP_ROOM_DELETE_CONCURRENCY,
+    TEMP_ROOM_EMPTY_TIMEOUT,
+    TEMP_ROOM_NEGATIVE_CACHE_TTL,
+)
 from domain.entities import ChannelType
 from presentation.views import TempRoomControlView, create_temp_room_embed
 
 logger = logging.getLogger(__name__)
 audit = logging.getLogger("audit")
 
+# 🗄️ SQL de salas temporárias
+# 💡 Mesmo texto em todas as chamadas: o cache de statements do sqlite3 reaproveita
+# a consulta já preparada em vez de recompilar a cada execução
+_MARK_INACTIVE_SQL = (
+    "UPDATE temporary_channels "
+    "SET is_active = 0, deleted_at = CURRENT_TIMESTAMP "
+    "WHERE channel_id = ?"
+)
+_SELECT_ACTIVE_IDS_SQL = (
+    "SELECT channel_id FROM temporary_channels WHERE is_active = 1"
+)
+_MARK_INACTIVE_IN_SQL = (
+    "UPDATE temporary_channels "
+    "SET is_active = 0, deleted_at = CURRENT_TIMESTAMP "
+    "WHERE channel_id IN"
+)
+# IDs por UPDATE ... IN: abaixo do limite de variáveis do SQLite
+_SQL_IN_CHUNK = 500
+_SELECT_ACTIVE_SQL = (
+    "SELECT channel_id, channel_name FROM temporary_channels "
+    "WHERE guild_id = ? AND is_active = 1"
+)
+
+# 🔑 Permissões do dono da sala temporária
+# 💡 discord.py só lê o overwrite ao montar a requisição: uma instância basta
+_OWNER_OVERWRITE = discord.PermissionOverwrite(
+    connect=True,
+    speak=True,
+    stream=True,
+    manage_channels=True,  # Pode editar configurações da sala
+)
+
+# 📨 Mensagem de boas-vindas do fórum privado (montada uma vez no import)
+_FORUM_WELCOME_TEMPLATE = (
+    "## Olá, {mention}!\n\n"
+    "Este é o seu **fórum privado pessoal**!\n\n"
+    "### O que você pode fazer aqui:\n"
+    "-  **Criar threads privadas**: Clique em 'Nova Postagem' para criar "
+    "tópicos privados\n"
+    "-  **Editar o nome**: Clique com botão direito no canal 'Editar Canal'\n"
+    "-  **Gerenciar mensagens**: Delete ou edite qualquer mensagem\n"
+    "-  **Privacidade total**: Apenas você pode ver este canal e seus posts!\n"
+    "-  **Personalizar**: Mude o nome, descrição, tags e tudo mais!\n\n"
+    "### Dicas:\n"
+    "- Use tags para organizar seus tópicos\n"
+    "- Threads são arquivadas após 7 dias de inatividade\n"
+    "- Você tem controle total sobre este espaço!\n"
+    "- **Importante**: Criar posts PRIVADOS (não públicos)\n\n"
+    "**Divirta-se organizando suas ideias!**"
+)
+
+# 📨 Mensagem de boas-vindas do fórum único por categoria
+_UNIQUE_FORUM_WELCOME_TEMPLATE = (
+    "## Olá, {mention}!\n\n"
+    "Este é o seu **fórum privado único**! 🎉\n\n"
+    "### Características especiais:\n"
+    "- 🔒 **Totalmente privado**: Apenas você pode ver!\n"
+    "- ✏️ **Personalizável**: Edite nome, descrição e tudo mais\n"
+    "- 🗂️ **Organize suas ideias**: Crie posts privados\n"
+    "- 🔧 **Controle total**: Gerencie todas as mensagens\n"
+    "- 🌟 **Único**: Este é seu ÚNICO fórum nesta categoria!\n\n"
+    "**Aproveite seu espaço pessoal!** 🎊"
+)
+
 
 class ChannelController:
     """
@@ -41,6 +115,165 @@ class ChannelController:
         self.create_channel_use_case = CreateChannelUseCase(channel_repository)
         self.create_forum_use_case = CreateForumUseCase(channel_repository)
 
+        # ⚡ Cache das consultas feitas a cada evento de voz
+        # 💡 Salas temporárias valem até serem invalidadas (só o bot as cria);
+        # o resto expira após TEMP_ROOM_NEGATIVE_CACHE_TTL (monotonic), inclusive
+        # categorias geradoras, que também podem ser marcadas fora daqui
+        self._temp_channel_ids: set[int] = set()
+        self._temp_categories: dict[tuple[int, int], float] = {}
+        self._not_temp_channels: dict[int, float] = {}
+        self._not_temp_categories: dict[tuple[int, int], float] = {}
+        # 💡 Pré-carga das salas ativas: tentada uma vez só, no primeiro evento
+        self._temp_ids_loaded = False
+        # ⏳ Deleção pendente de sala vazia, por canal (uma por vez)
+        self._pending_deletions: dict[int, asyncio.Task] = {}
+
+        # 🗄️ Conexão SQLite compartilhada (aberta sob demanda em _get_db)
+        self._db: aiosqlite.Connection | None = None
+        self._db_lock = asyncio.Lock()
+
+    def _cached_temp_channel(self, channel_id: int) -> bool | None:
+        """⚡ Canal é temporário, segundo o cache (None = desconhecido)"""
+        if channel_id in self._temp_channel_ids:
+            return True
+        expires = self._not_temp_channels.get(channel_id)
+        if expires is not None and expires > time.monotonic():
+            return False
+        return None
+
+    def _store_temp_channel(self, channel_id: int, *, is_temp: bool) -> None:
+        """💾 Guarda no cache se o canal é temporário"""
+        if is_temp:
+            self._temp_channel_ids.add(channel_id)
+            self._not_temp_channels.pop(channel_id, None)
+        else:
+            self._temp_channel_ids.discard(channel_id)
+            self._not_temp_channels[channel_id] = (
+                time.monotonic() + TEMP_ROOM_NEGATIVE_CACHE_TTL
+            )
+
+    def _cached_temp_category(self, key: tuple[int, int]) -> bool | None:
+        """⚡ Categoria é geradora, segundo o cache (None = desconhecido)"""
+        now = time.monotonic()
+        expires = self._temp_categories.get(key)
+        if expires is not None and expires > now:
+            return True
+        expires = self._not_temp_categories.get(key)
+        if expires is not None and expires > now:
+            return False
+        return None
+
+    def _store_temp_category(
+        self, key: tuple[int, int], *, is_generator: bool
+    ) -> None:
+        """💾 Guarda no cache se a categoria é geradora"""
+        expires = time.monotonic() + TEMP_ROOM_NEGATIVE_CACHE_TTL
+        if is_generator:
+            self._temp_categories[key] = expires
+            self._not_temp_categories.pop(key, None)
+        else:
+            self._temp_categories.pop(key, None)
+            self._not_temp_categories[key] = expires
+
+    async def _load_temp_channel_ids(self) -> None:
+        """
+        📥 Carrega do banco os IDs de todas as salas temporárias ativas
+
+        💡 Boa Prática: Uma consulta só aquece o cache das salas existentes!
+        Canais fora do set continuam caindo no cache negativo (TTL) e no
+        banco, então salas gravadas por outro processo não ficam invisíveis.
+        """
+        # 💡 Falhou? Não tenta de novo a cada evento; as consultas vão ao banco
+        self._temp_ids_loaded = True
+        try:
+            async with self._db_lock:
+                db = await self._get_db()
+                async with db.execute(_SELECT_ACTIVE_IDS_SQL) as cursor:
+                    # 💡 Atualizado sob o lock: nenhuma remoção fica para trás
+                    self._temp_channel_ids.update(
+                        [channel_id async for (channel_id,) in cursor]
+                    )
+        except aiosqlite.Error:
+            logger.exception("%s | ❌ Erro ao carregar salas temporárias", __name__)
+        else:
+            logger.debug(
+                "%s | 📥 %d salas temporárias ativas carregadas",
+                __name__,
+                len(self._temp_channel_ids),
+            )
+
+    async def _is_temporary_channel(self, channel_id: int, guild_id: int) -> bool:
+        """
+        🔍 is_temporary_channel do repository com cache em memória
+
+        💡 Boa Prática: Evita um SELECT no SQLite a cada evento de voz!
+        """
+        is_temp = self._cached_temp_channel(channel_id)
+        if is_temp is None:
+            is_temp = await self.channel_repository.is_temporary_channel(
+                channel_id=channel_id,
+                guild_id=guild_id,
+            )
+            self._store_temp_channel(channel_id, is_temp=is_temp)
+        return is_temp
+
+    async def _is_temp_room_category(
+        self,
+        category_id: int,
+        guild_id: int,
+        category_name: str | None = None,
+    ) -> bool:
+        """
+        🔍 is_temp_room_category do repository com cache em memória
+        """
+        key = (guild_id, category_id)
+        is_generator = self._cached_temp_category(key)
+        if is_generator is None:
+            is_generator = await self.channel_repository.is_temp_room_category(
+                category_id=category_id,
+                guild_id=guild_id,
+                category_name=category_name,
+            )
+            self._store_temp_category(key, is_generator=is_generator)
+        return is_generator
+
+    async def _classify_voice_channel(
+        self,
+        channel_id: int,
+        category_id: int,
+        guild_id: int,
+        category_name: str | None = None,
+    ) -> tuple[bool, bool]:
+        """
+        🔍 (canal é temporário, categoria é geradora) com cache em memória
+
+        💡 Boa Prática: O que faltar no cache vem numa única consulta!
+        """
+        key = (guild_id, category_id)
+        is_temp = self._cached_temp_channel(channel_id)
+        is_generator = self._cached_temp_category(key)
+        # 💡 Sala temporária já responde a entrada; a categoria nem importa
+        if is_temp or (is_temp is False and is_generator is not None):
+            return is_temp, bool(is_generator)
+
+        try:
+            (
+                is_temp,
+                is_generator,
+            ) = await self.channel_repository.classify_voice_channel(
+                channel_id=channel_id,
+                category_id=category_id,
+                guild_id=guild_id,
+                category_name=category_name,
+            )
+        except aiosqlite.Error:
+            # 💡 Sem cachear: o próximo evento consulta o banco de novo
+            logger.exception("%s | ❌ Erro ao classificar canal de voz", __name__)
+            return False, False
+        self._store_temp_channel(channel_id, is_temp=is_temp)
+        self._store_temp_category(key, is_generator=is_generator)
+        return is_temp, is_generator
+
     async def handle_create_text_channel(
         self,
         interaction: discord.Interaction,
@@ -54,9 +287,13 @@ class ChannelController:
             await interaction.response.send_message(
                 "❌ Nome do canal não pode estar vazio!",
                 ephemeral=True,
+                delete_after=10,
             )
             return
 
+        # 💡 Reconhece a interação antes do trabalho lento (DB + REST)
+        await interaction.response.defer(ephemeral=True)
+
         try:
             request = CreateChannelDTO(
                 name=name,
@@ -68,29 +305,23 @@ class ChannelController:
             result = await self.create_channel_use_case.execute(request)
 
             # Responde baseado no resultado
-            match result.created:
-                case True:
-                    await interaction.response.send_message(
-                        f"✅ Canal de texto **{result.name}** criado com sucesso!",
-                        ephemeral=True,
-                    )
-                case False:
-                    if result.id > 0:
-                        await interaction.response.send_message(
-                            "⚠️ Canal já existe! Não criado duplicata.",
-                            ephemeral=True,
-                        )
-                    else:
-                        await interaction.response.send_message(
-                            f"❌ Falha ao criar canal **{name}**. Tente novamente.",
-                            ephemeral=True,
-                        )
+            if result.created:
+                await interaction.followup.send(
+                    f"✅ Canal de texto **{result.name}** criado com sucesso!",
+                )
+            elif result.id > 0:
+                await interaction.followup.send(
+                    "⚠️ Canal já existe! Não criado duplicata.",
+                )
+            else:
+                await interaction.followup.send(
+                    f"❌ Falha ao criar canal **{name}**. Tente novamente.",
+                )
 
         except Exception:
             logger.exception("❌ Erro inesperado ao criar canal: %s", name)
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "❌ Erro interno do servidor. Tente novamente em alguns minutos.",
-                ephemeral=True,
             )
 
     async def handle_create_voice_channel(
@@ -106,23 +337,28 @@ class ChannelController:
             await interaction.response.send_message(
                 "Nome do canal não pode estar vazio!",
                 ephemeral=True,
+                delete_after=10,
             )
             return
 
         # Validação do limite de usuários
-        match user_limit:
-            case x if x < 0:
-                await interaction.response.send_message(
-                    "❌ Limite de usuários não pode ser negativo!",
-                    ephemeral=True,
-                )
-                return
-            case x if x > 99:
-                await interaction.response.send_message(
-                    "❌ Limite máximo é 99 usuários!",
-                    ephemeral=True,
-                )
-                return
+        if user_limit < 0:
+            await interaction.response.send_message(
+                "❌ Limite de usuários não pode ser negativo!",
+                ephemeral=True,
+                delete_after=10,
+            )
+            return
+        if user_limit > 99:
+            await interaction.response.send_message(
+                "❌ Limite máximo é 99 usuários!",
+                ephemeral=True,
+                delete_after=10,
+            )
+            return
+
+        # 💡 Reconhece a interação antes do trabalho lento (DB + REST)
+        await interaction.response.defer(ephemeral=True)
 
         try:
             request = CreateChannelDTO(
@@ -134,29 +370,23 @@ class ChannelController:
 
             result = await self.create_channel_use_case.execute(request)
 
-            match result.created:
-                case True:
-                    await interaction.response.send_message(
-                        f"✅ Canal de voz **{result.name}** criado com sucesso!",
-                        ephemeral=True,
-                    )
-                case False:
-                    if result.id > 0:
-                        await interaction.response.send_message(
-                            "⚠️ Canal já existe! Não criado duplicata.",
-                            ephemeral=True,
-                        )
-                    else:
-                        await interaction.response.send_message(
-                            f"❌ Falha ao criar canal **{name}**. Tente novamente.",
-                            ephemeral=True,
-                        )
+            if result.created:
+                await interaction.followup.send(
+                    f"✅ Canal de voz **{result.name}** criado com sucesso!",
+                )
+            elif result.id > 0:
+                await interaction.followup.send(
+                    "⚠️ Canal já existe! Não criado duplicata.",
+                )
+            else:
+                await interaction.followup.send(
+                    f"❌ Falha ao criar canal **{name}**. Tente novamente.",
+                )
 
         except Exception:
             logger.exception("Erro inesperado ao criar canal de voz: %s", name)
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "Erro interno do servidor. Tente novamente em alguns minutos.",
-                ephemeral=True,
             )
 
     async def handle_create_member_text_channel(
@@ -185,11 +415,14 @@ class ChannelController:
         Returns:
             bool: True se fórum foi criado com sucesso
         """
+        # 💡 display_name é property (apelido ou nome): resolvida uma vez só
+        display = member.display_name
+
         try:
-            logger.debug("🏠 Criando fórum privado para %s", member.display_name)
+            logger.debug("🏠 Criando fórum privado para %s", display)
 
             # Gera nome do fórum baseado no membro
-            forum_name = f"{member.display_name.lower()}"
+            forum_name = display.lower()
 
             # Chama repository para criar fórum com permissões especiais
             forum_channel = await self.channel_repository.create_private_forum_channel(
@@ -204,21 +437,8 @@ class ChannelController:
                 # Cria thread inicial com instruções
                 welcome_thread = await forum_channel.create_thread(
                     name="Bem-vindo ao seu fórum!",
-                    content=(
-                        f"## Olá, {member.mention}!\n\n"
-                        f"Este é o seu **fórum privado pessoal**!\n\n"
-                        f"### O que você pode fazer aqui:\n"
-                        f"-  **Criar threads privadas**: Clique em 'Nova Postagem' para criar tópicos privados\n"
-                        f"-  **Editar o nome**: Clique com botão direito no canal 'Editar Canal'\n"
-                        f"-  **Gerenciar mensagens**: Delete ou edite qualquer mensagem\n"
-                        f"-  **Privacidade total**: Apenas você pode ver este canal e seus posts!\n"
-                        f"-  **Personalizar**: Mude o nome, descrição, tags e tudo mais!\n\n"
-                        f"### Dicas:\n"
-                        f"- Use tags para organizar seus tópicos\n"
-                        f"- Threads são arquivadas após 7 dias de inatividade\n"
-                        f"- Você tem controle total sobre este espaço!\n"
-                        f"- **Importante**: Criar posts PRIVADOS (não públicos)\n\n"
-                        f"**Divirta-se organizando suas ideias!**"
+                    content=_FORUM_WELCOME_TEMPLATE.format_map(
+                        {"mention": member.mention}
                     ),
                 )
 
@@ -234,19 +454,19 @@ class ChannelController:
             ) as thread_error:
                 logger.debug(
                     "⚠️ Não foi possível criar thread de boas-vindas: %s",
-                    str(thread_error),
+                    thread_error,
                 )
 
             logger.info(
                 "📰 Fórum privado criado para %s",
-                member.display_name,
+                display,
                 extra={"member_id": member.id, "forum_name": forum_channel.name},
             )
 
         except Exception:
             logger.exception(
                 "Erro ao criar fórum para membro %s",
-                member.display_name,
+                display,
             )
             return False
         else:
@@ -267,7 +487,6 @@ class ChannelController:
         🏫 Cria fórum seguindo Clean Architecture
 
         💡 Boa Prática: Delega para Use Case que valida e persiste
-        💡 Pattern matching para cada caso de resultado
 
         Args:
             forum_name: Nome do fórum
@@ -293,30 +512,28 @@ class ChannelController:
                 creator_id=creator_id,
             )
 
-            # 💡 Boa Prática: Pattern matching para cada caso específico
-            match result.created, result.id > 0:
-                case True, _:
-                    # ✅ Sucesso! Fórum criado
-                    audit.info(
-                        f"{__name__} | 📝 Fórum criado com sucesso: {result.name}",
-                        extra={"forum_name": result.name, "forum_id": result.id},
-                    )
-                case False, True:
-                    # ⚠️ Aviso: Fórum já existe (NÃO é erro!)
-                    logger.debug(
-                        "%s | ℹ️ Fórum já existe | forum=%s | id=%s",
-                        __name__,
-                        forum_name,
-                        result.id,
-                    )
-                case False, False:
-                    # ❌ Erro: Falha na criação
-                    logger.error(
-                        "%s | ❌ Falha ao criar fórum | forum=%s",
-                        __name__,
-                        forum_name,
-                    )
-                    return False
+            if result.created:
+                # ✅ Sucesso! Fórum criado
+                audit.info(
+                    f"{__name__} | 📝 Fórum criado com sucesso: {result.name}",
+                    extra={"forum_name": result.name, "forum_id": result.id},
+                )
+            elif result.id > 0:
+                # ⚠️ Aviso: Fórum já existe (NÃO é erro!)
+                logger.debug(
+                    "%s | ℹ️ Fórum já existe | forum=%s | id=%s",
+                    __name__,
+                    forum_name,
+                    result.id,
+                )
+            else:
+                # ❌ Erro: Falha na criação
+                logger.error(
+                    "%s | ❌ Falha ao criar fórum | forum=%s",
+                    __name__,
+                    forum_name,
+                )
+                return False
 
         except Exception:
             logger.exception("❌ Erro ao processar criação de fórum: %s", forum_name)
@@ -341,27 +558,42 @@ class ChannelController:
         - Entrada em canal -> Cria sala temporária se categoria for geradora
         - Saída de canal -> Remove sala se ficou vazia
         """
+        # ⚡ Mute/deafen/câmera: mesmo canal, nada a fazer
+        if before.channel is after.channel:
+            return True
+
+        if not self._temp_ids_loaded:
+            await self._load_temp_channel_ids()
+
+        # 💡 Sem DEBUG, nem os argumentos dos logs são avaliados
+        dbg = logger.isEnabledFor(logging.DEBUG)
         try:
+            # Alguém voltou para uma sala vazia: desiste da deleção agendada
+            if after.channel:
+                self._cancel_pending_delete(after.channel.id)
+
             # Entrada em novo canal
             if (
                 after.channel
                 and after.channel.category
                 and before.channel != after.channel
             ):
-                logger.debug(
-                    "ENTRADA: %s -> '%s'",
-                    member.display_name,
-                    after.channel.name,
-                )
+                if dbg:
+                    logger.debug(
+                        "ENTRADA: %s -> '%s'",
+                        member.display_name,
+                        after.channel.name,
+                    )
                 await self._handle_channel_entry(member, after)
 
             # Saída de canal
             if before.channel and before.channel != after.channel:
-                logger.debug(
-                    "SAÍDA: %s -> '%s'",
-                    member.display_name,
-                    before.channel.name,
-                )
+                if dbg:
+                    logger.debug(
+                        "SAÍDA: %s -> '%s'",
+                        member.display_name,
+                        before.channel.name,
+                    )
                 await self._handle_channel_exit(member, before)
 
         except (discord.HTTPException, RuntimeError):
@@ -385,37 +617,50 @@ class ChannelController:
         if not after.channel:
             return False
 
-        # CHECK 1: Já está em sala temporária?
-        is_temp_channel = await self.channel_repository.is_temporary_channel(
-            channel_id=after.channel.id,
-            guild_id=member.guild.id,
-        )
+        dbg = logger.isEnabledFor(logging.DEBUG)
 
-        if is_temp_channel:
-            logger.debug(
-                "%s | 🔂 %s entrou em sala temporária existente",
-                __name__,
-                member.display_name,
+        # 💡 Os dois CHECKs abaixo saem de uma única consulta ao repository
+        category = after.channel.category
+        if category is None:
+            is_temp_channel = await self._is_temporary_channel(
+                channel_id=after.channel.id,
+                guild_id=member.guild.id,
             )
+            is_generator_category = False
+        else:
+            (
+                is_temp_channel,
+                is_generator_category,
+            ) = await self._classify_voice_channel(
+                channel_id=after.channel.id,
+                category_id=category.id,
+                guild_id=member.guild.id,
+                category_name=category.name,
+            )
+
+        # CHECK 1: Já está em sala temporária?
+        if is_temp_channel:
+            if dbg:
+                logger.debug(
+                    "%s | 🔂 %s entrou em sala temporária existente",
+                    __name__,
+                    member.display_name,
+                )
             return True
 
         # CHECK 2: Categoria é geradora?
-        if not after.channel.category:
-            logger.debug("%s | ⏭️ Canal sem categoria", __name__)
+        if category is None:
+            if dbg:
+                logger.debug("%s | ⏭️ Canal sem categoria", __name__)
             return False
 
-        is_generator_category = await self.channel_repository.is_temp_room_category(
-            category_id=after.channel.category.id,
-            guild_id=member.guild.id,
-            category_name=after.channel.category.name,
-        )
-
         if not is_generator_category:
-            logger.debug(
-                "%s | ⏭️ Categoria '%s' não é geradora",
-                __name__,
-                after.channel.category.name,
-            )
+            if dbg:
+                logger.debug(
+                    "%s | ⏭️ Categoria '%s' não é geradora",
+                    __name__,
+                    after.channel.category.name,
+                )
             return False
 
         # Categoria é geradora → Cria sala temporária
@@ -439,32 +684,31 @@ class ChannelController:
         """
         try:
             parent_channel = after.channel
+            # 💡 Properties lidas uma vez e reaproveitadas no DTO e nos logs
+            guild = member.guild
+            display = member.display_name
 
             # Copia as permissões (overwrites) do canal gerador
             # Isso garante que roles como "tecno" tenham as mesmas permissões
-            overwrites = parent_channel.overwrites.copy()
-
-            # Adiciona permissões especiais para o dono da sala
-            overwrites[member] = discord.PermissionOverwrite(
-                connect=True,
-                speak=True,
-                stream=True,
-                manage_channels=True,  # Pode editar configurações da sala
-            )
+            # 💡 A property já monta um dict novo a cada acesso: sem .copy()
+            overwrites = parent_channel.overwrites
 
             logger.debug(
                 "%s | 🔧 Copiando %d permissões do canal gerador '%s'",
                 __name__,
-                len(parent_channel.overwrites),
+                len(overwrites),
                 parent_channel.name,
             )
 
+            # Adiciona permissões especiais para o dono da sala
+            overwrites[member] = _OWNER_OVERWRITE
+
             # Cria DTO de criação com TODAS as configurações
             create_dto = CreateChannelDTO(
-                name=f"{parent_channel.name} - {member.display_name}",
+                name=f"{parent_channel.name} - {display}",
                 channel_type=ChannelType.VOICE,
-                guild_id=member.guild.id,
-                category_id=after.channel.category.id,
+                guild_id=guild.id,
+                category_id=parent_channel.category.id,
                 member_id=member.id,
                 is_temporary=True,
                 user_limit=parent_channel.user_limit,
@@ -476,76 +720,97 @@ class ChannelController:
                 "%s | � Criando sala temporária '%s' para %s",
                 __name__,
                 create_dto.name,
-                member.display_name,
+                display,
             )
 
             # Executa criação
             result = await self.create_channel_use_case.execute(create_dto)
 
             if result.id > 0:
-                # Envia embed com controles ANTES de mover (evita duplicatas)
+                # 💡 Só a sala criada agora é temporária com certeza: um canal
+                # existente de mesmo nome pode ser permanente
+                if result.created:
+                    self._store_temp_channel(result.id, is_temp=True)
+
+                # Envia embed com controles junto com o move_to
                 # Boa Prática: Envia embed APENAS se sala foi CRIADA
                 # (result.created = True)
-                new_channel = member.guild.get_channel(result.id)
-
-                if new_channel and isinstance(new_channel, discord.VoiceChannel):
+                new_channel = guild.get_channel(result.id)
+                if new_channel is None:
+                    # 💡 Recém-criado: o CHANNEL_CREATE pode não ter chegado ao cache
+                    with contextlib.suppress(discord.HTTPException):
+                        new_channel = await guild.fetch_channel(result.id)
+
+                # 💡 discord.py só cria VoiceChannel para type == voice
+                if (
+                    new_channel is not None
+                    and new_channel.type is discord.ChannelType.voice
+                ):
                     # ✅ Verifica se sala foi REALMENTE criada nesta chamada
                     if result.created:
-                        try:
-                            # Cria embed informativa
-                            embed = create_temp_room_embed(new_channel, member)
-
-                            # Cria view com botões de controle
-                            view = TempRoomControlView(
-                                voice_channel=new_channel,
-                                owner_id=member.id,
-                                timeout=None,  # View nunca expira
-                            )
+                        # Cria embed informativa
+                        embed = create_temp_room_embed(new_channel, member)
+
+                        # Cria view com botões de controle
+                        view = TempRoomControlView(
+                            voice_channel=new_channel,
+                            owner_id=member.id,
+                            timeout=None,  # View nunca expira
+                        )
 
+                        # 💡 Envio da embed e move_to não dependem um do outro:
+                        # as duas requisições REST correm juntas
+                        sent, moved = await asyncio.gather(
                             # Envia diretamente no canal de voz
                             # (como mensagem inicial)
-                            await new_channel.send(
+                            new_channel.send(
                                 content=(
                                     f"{member.mention} Bem-vindo à sua sala temporária!"
                                 ),
                                 embed=embed,
                                 view=view,
-                            )
+                            ),
+                            member.move_to(new_channel),
+                            return_exceptions=True,
+                        )
 
+                        if isinstance(sent, discord.HTTPException):
+                            # Não falha a criação da sala se embed der erro
+                            logger.error(
+                                "%s | ❌ Erro ao enviar embed de controle",
+                                __name__,
+                                exc_info=sent,
+                            )
+                        elif isinstance(sent, BaseException):
+                            raise sent
+                        else:
                             logger.debug(
                                 "%s | 💬 Embed de controle enviada | canal=%s",
                                 __name__,
                                 new_channel.name,
                             )
 
-                        except (
-                            discord.HTTPException,
-                            discord.Forbidden,
-                        ):
-                            logger.exception(
-                                "%s | ❌ Erro ao enviar embed de controle",
-                                __name__,
-                            )
-                            # Não falha a criação da sala se embed der erro
+                        if isinstance(moved, BaseException):
+                            raise moved
                     else:
                         logger.debug(
                             "%s | ⏭️ Sala já existia, embed NÃO enviada | canal=%s",
                             __name__,
                             new_channel.name,
                         )
+                        await member.move_to(new_channel)
 
-                    await member.move_to(new_channel)
                     logger.info(
                         "%s | 🎤 %s movido para '%s'",
                         __name__,
-                        member.display_name,
+                        display,
                         new_channel.name,
                     )
 
                 else:
                     logger.error("%s | ❌ Canal ID %s não encontrado", __name__, result.id)
             else:
-                logger.error("%s | ❌ Falha ao criar sala para %s", __name__, member.display_name)
+                logger.error("%s | ❌ Falha ao criar sala para %s", __name__, display)
 
         except (discord.HTTPException, RuntimeError):
             logger.exception("%s | ❌ Erro ao criar sala temporária", __name__)
@@ -560,74 +825,130 @@ class ChannelController:
     ) -> bool:
         """
         Processa saída de canal de voz.
-        Remove sala temporária se ficou vazia após 3 segundos.
+        Agenda a remoção da sala temporária se ela ficou vazia.
         """
         if not before.channel:
             return False
 
-        logger.debug(
-            "%s | 🚪 %s saiu do canal '%s'",
-            __name__,
-            member.display_name,
-            before.channel.name,
-        )
+        dbg = logger.isEnabledFor(logging.DEBUG)
+        if dbg:
+            logger.debug(
+                "%s | 🚪 %s saiu do canal '%s'",
+                __name__,
+                member.display_name,
+                before.channel.name,
+            )
 
         # Verifica se é sala temporária
-        is_temp_channel = await self.channel_repository.is_temporary_channel(
+        is_temp_channel = await self._is_temporary_channel(
             channel_id=before.channel.id,
             guild_id=member.guild.id,
         )
 
         if not is_temp_channel:
-            logger.debug("%s | ⏭️ Canal '%s' não é temporário", __name__, before.channel.name)
+            if dbg:
+                logger.debug(
+                    "%s | ⏭️ Canal '%s' não é temporário",
+                    __name__,
+                    before.channel.name,
+                )
             return False
 
         # Verifica se está vazio
-        channel_is_empty = len(before.channel.members) == 0
+        # 💡 .members percorre os voice states do servidor: lido uma vez só
+        members_now = before.channel.members
 
-        if not channel_is_empty:
+        if members_now:
+            if dbg:
+                logger.debug(
+                    "%s | ℹ️ Sala temporária '%s' ainda tem %d membros",
+                    __name__,
+                    before.channel.name,
+                    len(members_now),
+                )
+            return False
+
+        # Sala está vazia → Agenda a deleção
+        if dbg:
             logger.debug(
-                "%s | ℹ️ Sala temporária '%s' ainda tem %d membros",
+                "%s | ⏳ Sala temporária '%s' ficou vazia. "
+                "Aguardando %ss antes de deletar...",
                 __name__,
                 before.channel.name,
-                len(before.channel.members),
+                TEMP_ROOM_EMPTY_TIMEOUT,
             )
-            return False
+        self._schedule_delete(before.channel.id, member)
+        return True
 
-        # Sala está vazia → Aguarda 3s antes de deletar
-        logger.debug(
-            "%s | ⏳ Sala temporária '%s' ficou vazia. Aguardando 3s antes de deletar...",
-            __name__,
-            before.channel.name,
+    def _schedule_delete(self, channel_id: int, member: discord.Member) -> None:
+        """
+        ⏳ Agenda (ou reagenda) a deleção de uma sala temporária vazia
+
+        💡 Boa Prática: Uma única verificação pendente por canal; saídas
+        repetidas reiniciam o prazo em vez de acumular tasks!
+        """
+        pending = self._pending_deletions.get(channel_id)
+        if pending is not None:
+            pending.cancel()
+        self._pending_deletions[channel_id] = asyncio.create_task(
+            self._delayed_delete(channel_id, member)
         )
 
-        await asyncio.sleep(3)
+    def _cancel_pending_delete(self, channel_id: int) -> None:
+        """❌ Cancela a deleção agendada de um canal, se houver"""
+        pending = self._pending_deletions.pop(channel_id, None)
+        if pending is not None:
+            pending.cancel()
 
-        # Verifica novamente após aguardar
+    async def _delayed_delete(self, channel_id: int, member: discord.Member) -> bool:
+        """
+        🗑️ Deleta a sala após TEMP_ROOM_EMPTY_TIMEOUT se ela continuar vazia
+
+        💡 Roda numa task própria: erro não tratado aqui vira "Task exception
+        was never retrieved" (RuntimeError = sessão HTTP já fechada)
+        """
         try:
-            channel_check = member.guild.get_channel(before.channel.id)
+            await asyncio.sleep(TEMP_ROOM_EMPTY_TIMEOUT)
+
+            # 💡 Passado o prazo, sai da fila: a partir daqui não é mais cancelada
+            # (uma task cancelada já foi substituída ou removida)
+            if self._pending_deletions.get(channel_id) is asyncio.current_task():
+                del self._pending_deletions[channel_id]
+
+            # Verifica novamente após aguardar
+            channel_check = member.guild.get_channel(channel_id)
 
             if channel_check is None:
                 logger.debug("%s | ⏭️ Canal já foi removido", __name__)
                 return True
 
-            if len(channel_check.members) > 0:
+            members_after = channel_check.members
+            if members_after:
                 logger.debug(
                     "%s | ℹ️ Canal '%s' não está mais vazio (%d membros), mantendo",
                     __name__,
                     channel_check.name,
-                    len(channel_check.members),
+                    len(members_after),
                 )
                 return True
 
             # Confirma vazio → Deleta
             logger.debug(
-                "%s | 🗑️ Confirmado vazio após 3s. Deletando: '%s'",
+                "%s | 🗑️ Confirmado vazio após %ss. Deletando: '%s'",
                 __name__,
+                TEMP_ROOM_EMPTY_TIMEOUT,
                 channel_check.name,
             )
 
-            # Marca no banco como inativo
+            # Remove do Discord primeiro; só então marca inativo no banco
+            # 💡 Se a deleção falhar, linha e cache ficam para a limpeza repetir
+            with contextlib.suppress(discord.NotFound):
+                await channel_check.delete(
+                    reason=(
+                        "Sala temporária vazia - último usuário: "
+                        f"{member.display_name}"
+                    ),
+                )
             await self._remove_temp_channel_from_database(
                 channel_id=channel_check.id,
                 channel_name=channel_check.name,
@@ -636,21 +957,16 @@ class ChannelController:
                 else "",
             )
 
-            # Remove do Discord
-            await channel_check.delete(
-                reason=f"Sala temporária vazia - último usuário: {member.display_name}",
-            )
-
             audit.info(
                 f"{__name__} | 🗑️ Sala temporária '{channel_check.name}' removida",
                 extra={"channel_id": channel_check.id},
             )
 
-        except (discord.HTTPException, discord.Forbidden):
+        except (discord.HTTPException, RuntimeError):
             logger.exception(
-                "%s | ❌ Erro ao deletar canal '%s'",
+                "%s | ❌ Erro ao deletar canal %s",
                 __name__,
-                before.channel.name,
+                channel_id,
             )
             return False
         else:
@@ -690,6 +1006,7 @@ class ChannelController:
             )
 
             if success:
+                self._store_temp_category((guild_id, category.id), is_generator=True)
                 audit.info(
                     f"{__name__} | 🏗️ Categoria '{category.name}' marcada como geradora",
                     extra={"category_id": category.id, "guild_id": guild_id},
@@ -703,6 +1020,31 @@ class ChannelController:
         else:
             return success
 
+    async def _delete_temp_channel(
+        self,
+        channel_id: int,
+        semaphore: asyncio.Semaphore,
+    ) -> bool:
+        """
+        🗑️ Deleta uma sala temporária do Discord, registrando a própria falha
+
+        💡 Boa Prática: Erro de um canal não cancela os demais no TaskGroup!
+        """
+        try:
+            async with semaphore:
+                success = await self.channel_repository.delete_channel(
+                    channel_id=channel_id,
+                )
+        except discord.HTTPException:
+            logger.exception("%s | ❌ Erro ao deletar canal %s", __name__, channel_id)
+            return False
+
+        if success:
+            logger.debug("🗑️ Canal %s deletado", channel_id)
+        else:
+            logger.debug("ℹ️ Canal %s não encontrado no Discord", channel_id)
+        return success
+
     async def handle_unmark_category_as_temp_generator(
         self,
         category_id: int,
@@ -735,28 +1077,16 @@ class ChannelController:
                     category_id,
                 )
 
-                for channel_id in channel_ids:
-                    try:
-                        # Deleta canal do Discord
-                        success = await self.channel_repository.delete_channel(
-                            channel_id=channel_id,
-                        )
-
-                        if success:
-                            deleted_count += 1
-                            logger.debug("🗑️ Canal %s deletado", channel_id)
-                        else:
-                            logger.debug(
-                                "ℹ️ Canal %s não encontrado no Discord",
-                                channel_id,
-                            )
-
-                    except (discord.HTTPException, discord.Forbidden):
-                        logger.exception(
-                            "%s | ❌ Erro ao deletar canal %s",
-                            __name__,
-                            channel_id,
+                # 💡 Deleções em paralelo, limitadas para respeitar o rate limit
+                semaphore = asyncio.Semaphore(TEMP_ROOM_DELETE_CONCURRENCY)
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(
+                            self._delete_temp_channel(channel_id, semaphore)
                         )
+                        for channel_id in channel_ids
+                    ]
+                deleted_count = sum(1 for task in tasks if task.result())
 
                 # Log do resultado da limpeza com pattern matching
                 match deleted_count:
@@ -778,6 +1108,7 @@ class ChannelController:
                 category_id=category_id,
                 guild_id=guild_id,
             )
+            self._temp_categories.pop((guild_id, category_id), None)
 
             if success:
                 audit.info(
@@ -951,16 +1282,8 @@ class ChannelController:
                 try:
                     await forum_channel.create_thread(
                         name="Bem-vindo ao seu espaço único!",
-                        content=(
-                            f"## Olá, {member.mention}!\n\n"
-                            f"Este é o seu **fórum privado único**! 🎉\n\n"
-                            f"### Características especiais:\n"
-                            f"- 🔒 **Totalmente privado**: Apenas você pode ver!\n"
-                            f"- ✏️ **Personalizável**: Edite nome, descrição e tudo mais\n"
-                            f"- 🗂️ **Organize suas ideias**: Crie posts privados\n"
-                            f"- 🔧 **Controle total**: Gerencie todas as mensagens\n"
-                            f"- 🌟 **Único**: Este é seu ÚNICO fórum nesta categoria!\n\n"
-                            f"**Aproveite seu espaço pessoal!** 🎊"
+                        content=_UNIQUE_FORUM_WELCOME_TEMPLATE.format_map(
+                            {"mention": member.mention}
                         ),
                     )
                     logger.debug("🧵 Thread de boas-vindas criada")
@@ -971,7 +1294,7 @@ class ChannelController:
                 ) as thread_error:
                     logger.debug(
                         "ℹ️ Não foi possível criar thread de boas-vindas: %s",
-                        str(thread_error),
+                        thread_error,
                     )
 
             else:
@@ -995,6 +1318,38 @@ class ChannelController:
     # LIMPEZA E MANUTENÇÃO
     # ---------------------------------------------------------------
 
+    async def _get_db(self) -> aiosqlite.Connection:
+        """
+        🗄️ Conexão SQLite compartilhada do controller (aberta no primeiro uso)
+
+        💡 Boa Prática: Uma conexão (e uma thread do aiosqlite) para todas as
+        operações, com os PRAGMAs aplicados uma única vez!
+        Deve ser chamado com self._db_lock adquirido.
+        """
+        if self._db is None:
+            db = await aiosqlite.connect(DB_PATH)
+            await db.execute("PRAGMA journal_mode = WAL")
+            await db.execute("PRAGMA synchronous = NORMAL")
+            await db.execute(f"PRAGMA cache_size = {DATABASE_CACHE_SIZE}")
+            await db.execute("PRAGMA temp_store = MEMORY")
+            # 💡 Com outra conexão escrevendo, o SQLite espera em vez de "locked"
+            await db.execute(f"PRAGMA busy_timeout = {DATABASE_BUSY_TIMEOUT}")
+            self._db = db
+        return self._db
+
+    async def close(self) -> None:
+        """🔌 Cancela deleções agendadas e fecha a conexão SQLite compartilhada"""
+        pending = list(self._pending_deletions.values())
+        self._pending_deletions.clear()
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        async with self._db_lock:
+            if self._db is not None:
+                await self._db.close()
+                self._db = None
+
     async def _remove_temp_channel_from_database(
         self,
         channel_id: int,
@@ -1002,20 +1357,13 @@ class ChannelController:
         category_name: str = "",
     ) -> bool:
         """Marca canal temporário como inativo no banco de dados."""
-        import aiosqlite
-
         try:
-            db_path = DB_PATH
-            async with aiosqlite.connect(db_path) as db:
-                await db.execute(
-                    """
-                    UPDATE temporary_channels
-                    SET is_active = 0, deleted_at = CURRENT_TIMESTAMP
-                    WHERE channel_id = ?
-                    """,
-                    (channel_id,),
-                )
+            async with self._db_lock:
+                db = await self._get_db()
+                await db.execute(_MARK_INACTIVE_SQL, (channel_id,))
                 await db.commit()
+            # 💡 Os eventos de saída que ainda chegarem não voltam ao SQLite
+            self._store_temp_channel(channel_id, is_temp=False)
 
             logger.info(
                 "Canal temporário marcado como inativo | Nome: '%s' | "
@@ -1036,70 +1384,84 @@ class ChannelController:
         Remove todas as salas temporárias do servidor.
         Chamado quando bot desconecta.
         """
-        import aiosqlite
-
         removed_count = 0
+        # 📦 IDs a marcar como inativos, gravados num único executemany no fim
+        deleted_ids: list[int] = []
+        # 🚦 Limita deleções simultâneas para não estourar o rate limit
+        semaphore = asyncio.Semaphore(TEMP_ROOM_DELETE_CONCURRENCY)
 
-        try:
-            logger.debug("%s | 🧹 Iniciando limpeza de salas temporárias...", __name__)
+        async def _delete_one(channel_id: int, channel_name: str) -> None:
+            nonlocal removed_count
+            try:
+                channel = guild.get_channel(channel_id)
+                if channel:
+                    category_name = (
+                        channel.category.name if channel.category else "Sem categoria"
+                    )
+                    async with semaphore:
+                        await channel.delete(
+                            reason="Limpeza automática - Bot desconectando",
+                        )
+                    logger.debug(
+                        "%s | 🗑️ Sala removida: '%s' (Categoria: '%s')",
+                        __name__,
+                        channel_name,
+                        category_name,
+                    )
+                    removed_count += 1
 
-            db_path = DB_PATH
-            async with aiosqlite.connect(db_path) as db:
-                cursor = await db.execute(
-                    """
-                    SELECT channel_id, channel_name
-                    FROM temporary_channels
-                    WHERE guild_id = ? AND is_active = 1
-                    """,
-                    (guild.id,),
-                )
-                temp_channels = await cursor.fetchall()
+                # Canal removido agora ou já inexistente: inativa no banco
+                deleted_ids.append(channel_id)
 
-                logger.debug(
-                    "%s | ℹ️ Encontradas %d salas temporárias ativas",
+            except Exception:
+                logger.exception(
+                    "%s | ❌ Erro ao remover sala %s",
                     __name__,
-                    len(temp_channels),
+                    channel_name,
                 )
 
-                # Remove cada sala
-                for channel_id, channel_name in temp_channels:
-                    try:
-                        channel = guild.get_channel(channel_id)
-                        if channel:
-                            category_name = (
-                                channel.category.name
-                                if channel.category
-                                else "Sem categoria"
-                            )
-                            await channel.delete(
-                                reason="Limpeza automática - Bot desconectando",
-                            )
-                            logger.debug(
-                                "%s | 🗑️ Sala removida: '%s' (Categoria: '%s')",
-                                __name__,
-                                channel_name,
-                                category_name,
-                            )
-                            removed_count += 1
+        try:
+            logger.debug("%s | 🧹 Iniciando limpeza de salas temporárias...", __name__)
 
-                            await self._remove_temp_channel_from_database(
-                                channel_id=channel_id,
-                                channel_name=channel_name,
-                                category_name=category_name,
-                            )
-                        else:
-                            await self._remove_temp_channel_from_database(
-                                channel_id=channel_id,
-                                channel_name=channel_name,
-                            )
+            # 💡 Cada linha lida já dispara sua deleção (limitada pelo semáforo),
+            # enquanto o cursor continua trazendo as próximas do SQLite
+            delete_tasks: list[asyncio.Task] = []
+            async with self._db_lock:
+                db = await self._get_db()
+                async with db.execute(_SELECT_ACTIVE_SQL, (guild.id,)) as cursor:
+                    async for channel_id, channel_name in cursor:
+                        delete_tasks.append(
+                            asyncio.create_task(_delete_one(channel_id, channel_name))
+                        )
 
-                    except Exception:
-                        logger.exception(
-                            "%s | ❌ Erro ao remover sala %s",
-                            __name__,
-                            channel_name,
+            logger.debug(
+                "%s | ℹ️ Encontradas %d salas temporárias ativas",
+                __name__,
+                len(delete_tasks),
+            )
+
+            await asyncio.gather(*delete_tasks)
+
+            if deleted_ids:
+                async with self._db_lock:
+                    db = await self._get_db()
+                    # 💡 Um UPDATE ... IN (...) por lote, todos na mesma transação
+                    for start in range(0, len(deleted_ids), _SQL_IN_CHUNK):
+                        chunk = deleted_ids[start : start + _SQL_IN_CHUNK]
+                        placeholders = ", ".join("?" * len(chunk))
+                        await db.execute(
+                            f"{_MARK_INACTIVE_IN_SQL} ({placeholders})",
+                            chunk,
                         )
-                        continue
+                    await db.commit()
+                for channel_id in deleted_ids:
+                    self._store_temp_channel(channel_id, is_temp=False)
+                logger.info(
+                    "Canais temporários marcados como inativos | Servidor: %s | "
+                    "Total: %d",
+                    guild.id,
+                    len(deleted_ids),
+                )
 
             logger.debug(
                 "%s | ✅ Limpeza concluída! %d salas removidas",
@@ -1112,3 +1474,37 @@ class ChannelController:
             return removed_count
         else:
             return removed_count
+
+
+# 🔗 ChannelController de cada bot (manager, cogs e DIContainer usam o mesmo)
+_controllers: dict[discord.Client, ChannelController] = {}
+
+
+def get_channel_controller(bot: discord.Client) -> ChannelController:
+    """
+    🔗 Retorna o ChannelController do bot, montando-o no primeiro uso
+
+    💡 Boa Prática: Um único ponto de acesso; todos compartilham os mesmos
+    caches e a mesma conexão SQLite!
+    """
+    controller = _controllers.get(bot)
+    if controller is None:
+        from infrastructure.repositories import (
+            DiscordChannelRepository,
+            SQLiteCategoryRepository,
+        )
+
+        category_db_repository = SQLiteCategoryRepository()
+        channel_repository = DiscordChannelRepository(bot, category_db_repository)
+        controller = ChannelController(channel_repository)
+        _controllers[bot] = controller
+    return controller
+
+
+async def release_channel_controller(bot: discord.Client) -> None:
+    """
+    🔌 Fecha e descarta o ChannelController do bot (chamado no encerramento)
+    """
+    controller = _controllers.pop(bot, None)
+    if controller is not None:
+        await controller.close()